@@ -191,7 +191,7 @@ class SoftwareBuilderAgent:
 
         If this is a retry (issues present), uses reflection mode to fix the code.
         """
-        is_retry = bool(task.issues) and bool(task.previous_code)
+        is_retry = task.is_retry
 
         if is_retry:
             # ===== REFLECTION MODE: Fix code based on feedback =====
@@ -231,7 +231,7 @@ class SoftwareBuilderAgent:
 
         code, tests = _parse_builder_response(code_response.content)
 
-        self._emit("builder_coding_complete", {"code_lines": len(code.split("\n"))})
+        self._emit("builder_coding_complete", {"code_lines": code.count("\n") + 1})
 
         return CodeOutput(
             step_id=task.step_id,
@@ -285,7 +285,7 @@ class SoftwareBuilderAgent:
 
         code, tests = _parse_builder_response(code_response.content)
 
-        self._emit("builder_coding_complete", {"code_lines": len(code.split("\n"))})
+        self._emit("builder_coding_complete", {"code_lines": code.count("\n") + 1})
 
         return CodeOutput(
             step_id=task.step_id,
@@ -32,7 +32,7 @@ class CodeAgent:
         execution = agent.initiate_task("Write a sort function", None)
 
         async for event in execution.progress():
-            print(event.to_sse())
+            print(event.to_sse().decode())  # to_sse() returns bytes
     """
 
     def __init__(self, identifier_llm: BaseLLMClient, executor_llm: BaseLLMClient):
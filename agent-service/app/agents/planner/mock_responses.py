@@ -5,7 +5,9 @@ Provides deterministic responses for common task types to enable
 testing without hitting a real LLM API.
 """
 
-import json
+from functools import lru_cache
+
+import orjson
 
 # Mock responses keyed by task pattern
 MOCK_RESPONSES: dict[str, dict] = {
@@ -145,6 +147,14 @@ MOCK_RESPONSES: dict[str, dict] = {
 }
 
 
+# Canned responses encoded once at import, in MOCK_RESPONSES order
+_MOCK_RESPONSE_JSON: tuple[tuple[str, str], ...] = tuple(
+    (keyword, orjson.dumps(response_data, option=orjson.OPT_INDENT_2).decode())
+    for keyword, response_data in MOCK_RESPONSES.items()
+)
+
+
+@lru_cache(maxsize=128)
 def get_mock_plan_response(task: str) -> str:
     """
     Get a mock LLM response for a given task.
@@ -160,16 +170,16 @@ def get_mock_plan_response(task: str) -> str:
 
     Example:
         >>> response = get_mock_plan_response("Create a snake game")
-        >>> data = json.loads(response)
+        >>> data = orjson.loads(response)
         >>> len(data["steps"])
         5
     """
     task_lower = task.lower()
 
     # Check for keyword matches
-    for keyword, response_data in MOCK_RESPONSES.items():
+    for keyword, response_json in _MOCK_RESPONSE_JSON:
         if keyword in task_lower:
-            return json.dumps(response_data, indent=2)
+            return response_json
 
     # Default fallback for unknown tasks
     fallback = {
@@ -183,9 +193,10 @@ def get_mock_plan_response(task: str) -> str:
             }
         ],
     }
-    return json.dumps(fallback, indent=2)
+    return orjson.dumps(fallback, option=orjson.OPT_INDENT_2).decode()
 
 
+@lru_cache(maxsize=128)
 def get_mock_plan_response_with_markdown(task: str) -> str:
     """
     Get a mock response wrapped in markdown code block.
@@ -6,10 +6,24 @@ enabling parallel execution where possible and sequential execution where requir
 """
 
 from dataclasses import dataclass, field
+from graphlib import CycleError, TopologicalSorter
 from typing import Optional
 
-
-@dataclass
+# Characters that break Mermaid v11+ label parsing: brackets, parens and
+# angle brackets are dropped, double quotes become single quotes.
+# Applied in one str.translate pass.
+_MERMAID_LABEL_TABLE = str.maketrans({
+    "[": None,
+    "]": None,
+    "(": None,
+    ")": None,
+    '"': "'",
+    "<": None,
+    ">": None,
+})
+
+
+@dataclass(slots=True)
 class PlanStep:
     """
     Represents a single step in an execution plan.
@@ -59,7 +73,7 @@ class PlanStep:
             )
 
 
-@dataclass
+@dataclass(slots=True)
 class ProjectPlan:
     """
     Represents a complete execution plan for a project.
@@ -95,7 +109,7 @@ class ProjectPlan:
         """
         Compute execution order based on dependencies.
 
-        Uses a topological sort variant (Kahn's algorithm) to group steps
+        Uses graphlib.TopologicalSorter (Kahn's algorithm) to group steps
         into stages where all steps in a stage can run in parallel.
 
         Returns:
@@ -107,7 +121,8 @@ class ProjectPlan:
             - Stage N: Steps whose deps are all in Stages 0 to N-1
 
         Raises:
-            ValueError: If circular dependencies are detected.
+            ValueError: If step IDs are duplicated or circular dependencies
+                are detected.
 
         Example:
             >>> plan = ProjectPlan(
@@ -136,37 +151,55 @@ class ProjectPlan:
         # Build a map of step_id -> step for quick lookup
         step_map: dict[str, PlanStep] = {step.id: step for step in self.steps}
 
+        # Shared by both paths below: a repeated ID would otherwise be
+        # kept by the fast path but collapsed by the sorter
+        if len(step_map) != len(self.steps):
+            duplicates = {
+                step.id for step in self.steps if step_map[step.id] is not step
+            }
+            raise ValueError(f"Duplicate step IDs. Unable to stage: {duplicates}")
+
+        # Common case (e.g. every simple-task plan): no dependencies, so
+        # all steps form one stage and there is nothing to sort
+        if not any(step.depends_on for step in self.steps):
+            return [list(self.steps)]
+
+        # Original position of each step, to keep stage order stable
+        position = {step_id: index for index, step_id in enumerate(step_map)}
+
+        sorter = TopologicalSorter({step.id: step.depends_on for step in self.steps})
+        try:
+            sorter.prepare()
+        except CycleError as e:
+            raise ValueError(
+                f"Circular dependency detected. Unable to stage: {set(e.args[1])}"
+            ) from e
+
         # Track which steps have been assigned to a stage
         staged_ids: set[str] = set()
-
-        # Build initial dependency sets for each step
-        remaining_deps: dict[str, set[str]] = {
-            step.id: set(step.depends_on) for step in self.steps
-        }
-
         stages: list[list[PlanStep]] = []
 
-        while len(staged_ids) < len(self.steps):
-            # Find all steps whose dependencies are satisfied
-            ready_ids: list[str] = [
-                step_id
-                for step_id, deps in remaining_deps.items()
-                if step_id not in staged_ids and deps.issubset(staged_ids)
-            ]
+        while len(staged_ids) < len(step_map):
+            # All steps whose dependencies are satisfied. Unknown
+            # dependency IDs also surface here (they have no deps of their
+            # own); they are never marked done, so their dependents stay
+            # blocked.
+            ready_ids = [step_id for step_id in sorter.get_ready() if step_id in step_map]
 
             if not ready_ids:
-                # No progress possible - circular dependency detected
+                # No progress possible - a dependency can never be met
                 unstaged = set(step_map.keys()) - staged_ids
                 raise ValueError(
                     f"Circular dependency detected. Unable to stage: {unstaged}"
                 )
 
             # Create this stage with all ready steps
-            stage = [step_map[step_id] for step_id in ready_ids]
-            stages.append(stage)
+            ready_ids.sort(key=position.__getitem__)
+            stages.append([step_map[step_id] for step_id in ready_ids])
 
-            # Mark these steps as staged
+            # Mark these steps as staged, releasing their dependents
             staged_ids.update(ready_ids)
+            sorter.done(*ready_ids)
 
         return stages
 
@@ -202,18 +235,9 @@ class ProjectPlan:
 
         # Add all nodes first
         for step in self.steps:
-            # Escape special characters for Mermaid v11+
-            # Remove or replace characters that break Mermaid parsing
-            safe_task = step.task
-            safe_task = safe_task.replace("[", "")
-            safe_task = safe_task.replace("]", "")
-            safe_task = safe_task.replace("(", "")
-            safe_task = safe_task.replace(")", "")
-            safe_task = safe_task.replace('"', "'")
-            safe_task = safe_task.replace("<", "")
-            safe_task = safe_task.replace(">", "")
             # Use quoted label syntax for safety
-            lines.append(f'    {step.id}["{safe_task}"]')
+            label = step.task.translate(_MERMAID_LABEL_TABLE)
+            lines.append(f'    {step.id}["{label}"]')
 
         # Add all dependency edges
         for step in self.steps:
@@ -284,7 +308,7 @@ class ProjectPlan:
         step.status = status
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PlannerConfig:
     """
     Configuration options for the Planner Agent.
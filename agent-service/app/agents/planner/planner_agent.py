@@ -8,7 +8,7 @@ steps with dependencies, enabling parallel execution where possible.
 from datetime import datetime, timezone
 
 from app.llm import get_registry
-from app.logging_utils import log, short_id
+from app.logging_utils import log, logger, short_id
 
 from .models import PlanStep, ProjectPlan, PlannerConfig
 from .prompt import (
@@ -63,7 +63,7 @@ class PlannerAgent:
         if self.request_id:
             log(self.request_id, message)
         else:
-            print(f"[{self._rid}] {message}", flush=True)
+            logger.info(message, extra={"rid": self._rid})
 
     async def create_plan(self, task: str) -> tuple[ProjectPlan, list[dict]]:
         """
@@ -96,7 +96,7 @@ class PlannerAgent:
 
         # Analyze complexity
         word_count = len(task.split())
-        is_complex = is_complex_task(task, self.config)
+        is_complex = is_complex_task(task, self.config, word_count)
 
         self._log(f"Task complexity: {'complex' if is_complex else 'simple'} ({word_count} words)")
 
@@ -6,10 +6,11 @@ to decompose complex tasks into executable steps, plus utilities to
 parse and validate LLM responses.
 """
 
-import json
 import re
 from typing import Any
 
+import orjson
+
 from .models import PlanStep, ProjectPlan, PlannerConfig
 
 
@@ -63,7 +64,7 @@ Example for "Create a snake game":
 
 
 # Keywords that suggest a task needs multi-step planning
-COMPLEXITY_KEYWORDS = [
+COMPLEXITY_KEYWORDS = (
     "game",
     "application",
     "app",
@@ -85,7 +86,13 @@ COMPLEXITY_KEYWORDS = [
     "crud",
     "authentication",
     "database",
-]
+)
+
+# All keywords in one case-insensitive pattern, so a task is scanned once
+# rather than once per keyword. Matches substrings, like `keyword in task`.
+_COMPLEXITY_RE = re.compile(
+    "|".join(map(re.escape, COMPLEXITY_KEYWORDS)), re.IGNORECASE
+)
 
 
 def parse_llm_response(response: str, original_task: str) -> ProjectPlan:
@@ -116,8 +123,8 @@ def parse_llm_response(response: str, original_task: str) -> ProjectPlan:
 
     # Parse JSON
     try:
-        data = json.loads(json_str)
-    except json.JSONDecodeError as e:
+        data = orjson.loads(json_str)
+    except orjson.JSONDecodeError as e:
         raise ValueError(f"Invalid JSON in LLM response: {e}") from e
 
     # Validate top-level structure
@@ -242,7 +249,9 @@ def _parse_step(step_data: Any, index: int, existing_ids: set[str]) -> PlanStep:
     )
 
 
-def is_complex_task(task: str, config: PlannerConfig) -> bool:
+def is_complex_task(
+    task: str, config: PlannerConfig, word_count: int | None = None
+) -> bool:
     """
     Determine if a task needs multi-step planning.
 
@@ -253,6 +262,8 @@ def is_complex_task(task: str, config: PlannerConfig) -> bool:
     Args:
         task: The task description to analyze.
         config: PlannerConfig with complexity thresholds.
+        word_count: len(task.split()), if the caller has already
+            computed it. Counted here when omitted.
 
     Returns:
         True if task should go through planner, False if it can be
@@ -265,19 +276,14 @@ def is_complex_task(task: str, config: PlannerConfig) -> bool:
         >>> is_complex_task("Create a snake game with scoring", config)
         True
     """
-    task_lower = task.lower()
-
     # Check word count
-    word_count = len(task.split())
+    if word_count is None:
+        word_count = len(task.split())
     if word_count >= config.min_complexity_words:
         return True
 
     # Check for complexity keywords
-    for keyword in COMPLEXITY_KEYWORDS:
-        if keyword in task_lower:
-            return True
-
-    return False
+    return _COMPLEXITY_RE.search(task) is not None
 
 
 def format_planner_prompt(task: str, config: PlannerConfig) -> str:
@@ -8,17 +8,23 @@ REST endpoints for the code agent:
 """
 
 import asyncio
-import json
 import os
-import uuid
+import secrets
+import tempfile
+from pathlib import Path
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
-from typing import Optional
+from typing import AsyncIterator, Optional
 
 from app.core.task_state import TaskState, TaskStatus, TaskType
-from app.logging_utils import log_request_start, log_request_complete, log_request_failed
+from app.logging_utils import (
+    log,
+    log_request_start,
+    log_request_complete,
+    log_request_failed,
+)
 from app.tools.code_executor import CodeExecutor
-from app.api.workflow_events import result_event
+from app.api.workflow_events import encode_sse, result_event
 
 from fastapi.responses import StreamingResponse
 
@@ -70,6 +76,31 @@ class TaskResponse(BaseModel):
 tasks: dict[str, TaskState] = {}
 
 
+# ===== PROFILING =====
+
+async def _profiled_stream(
+    stream: AsyncIterator[bytes], task_id: str
+) -> AsyncIterator[bytes]:
+    """
+    Run an SSE stream under pyinstrument and write an HTML report.
+
+    Enabled with PROFILE_SSE=1 (requires the `profiling` extra).
+    Reports are written to the temp directory as <task_id>.html.
+    """
+    from pyinstrument import Profiler
+
+    profiler = Profiler(async_mode="enabled")
+    profiler.start()
+    try:
+        async for frame in stream:
+            yield frame
+    finally:
+        profiler.stop()
+        report_path = Path(tempfile.gettempdir()) / f"{task_id}.html"
+        profiler.write_html(report_path)
+        log(task_id, f"📊 Profile written to {report_path}")
+
+
 # ===== ENDPOINTS =====
 
 @router.post("", response_class=StreamingResponse)
@@ -99,7 +130,7 @@ async def create_task(request: TaskRequest):
     from app.llm import get_registry
     from app.agents.manager import ManagerAgent
 
-    task_id = f"task-{uuid.uuid4().hex[:8]}"
+    task_id = f"task-{secrets.token_hex(4)}"
 
     # Log request start
     mock_mode = os.getenv("USE_MOCK_LLM", "false").lower() == "true"
@@ -131,13 +162,20 @@ async def create_task(request: TaskRequest):
         event_callback=event_callback,
     )
 
+    # Outcome of the run, kept off the event queue so the stream loop
+    # only ever sees payload events
+    outcome: asyncio.Future = asyncio.get_running_loop().create_future()
+
     async def run_manager():
         """Run the manager and signal completion."""
         try:
-            result = await manager.run(request.description)
-            await event_queue.put({"_result": result})
+            outcome.set_result(await manager.run(request.description))
         except Exception as e:
-            await event_queue.put({"_error": str(e)})
+            outcome.set_exception(e)
+        except BaseException:
+            # Cancelled: resolve outcome so the stream never reads it unset
+            outcome.cancel()
+            raise
         finally:
             await event_queue.put(None)  # Signal end
 
@@ -145,28 +183,17 @@ async def create_task(request: TaskRequest):
         # Start manager in background task
         manager_task = asyncio.create_task(run_manager())
 
-        result = None
-        error = None
-
         try:
-            while True:
-                event_data = await event_queue.get()
-
-                if event_data is None:
-                    # End signal
-                    break
+            # Stream events immediately until the end signal
+            while (event_data := await event_queue.get()) is not None:
+                yield encode_sse(event_data)
 
-                if "_result" in event_data:
-                    result = event_data["_result"]
-                    continue
-
-                if "_error" in event_data:
-                    error = event_data["_error"]
-                    continue
-
-                # Stream the event immediately
-                json_data = json.dumps(event_data)
-                yield f"data: {json_data}\n\n"
+            if outcome.cancelled():
+                result, error = None, "Task was cancelled"
+            elif exc := outcome.exception():
+                result, error = None, str(exc)
+            else:
+                result, error = outcome.result(), None
 
             # Emit final result
             if result:
@@ -202,7 +229,7 @@ async def create_task(request: TaskRequest):
                     "error": error,
                     "task_id": task_id,
                 }
-                yield f"data: {json.dumps(error_event_data)}\n\n"
+                yield encode_sse(error_event_data)
 
                 log_request_failed(task_id, 0, error)
 
@@ -221,19 +248,30 @@ async def create_task(request: TaskRequest):
                 "error": str(e),
                 "task_id": task_id,
             }
-            yield f"data: {json.dumps(error_event_data)}\n\n"
+            yield encode_sse(error_event_data)
             log_request_failed(task_id, 0, str(e))
 
         finally:
-            # Ensure manager task is done
-            await manager_task
+            # Ensure manager task is done; its cancellation is already
+            # reported through outcome, so don't re-raise it here
+            await asyncio.wait({manager_task})
+            # Retrieve any stored exception if the client disconnected early
+            if outcome.done() and not outcome.cancelled():
+                outcome.exception()
+
+    stream = event_generator()
+    if os.getenv("PROFILE_SSE"):
+        stream = _profiled_stream(stream, task_id)
 
     return StreamingResponse(
-        event_generator(),
+        stream,
         media_type="text/event-stream",
         headers={
             "Cache-Control": "no-cache",
             "Connection": "keep-alive",
+            # Stop nginx/CDNs from buffering or compressing the stream
+            "X-Accel-Buffering": "no",
+            "Content-Encoding": "identity",
         }
     )
 
@@ -7,9 +7,16 @@ Events sent to clients showing real-time progress through the LangGraph workflow
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from enum import Enum
-import json
 from asyncio import Queue
 
+import orjson
+
+
+def encode_sse(payload: dict) -> bytes:
+    """Encode a payload as a UTF-8 Server-Sent Event frame."""
+    return b"data: " + orjson.dumps(payload) + b"\n\n"
+
+
 class WorkflowEventType(str, Enum):
     """Types of events during workflow execution."""
     # Legacy CodeAgent events (kept for backwards compatibility)
@@ -77,14 +84,13 @@ class WorkflowEvent:
         if self.timestamp is None:
             self.timestamp = datetime.now(timezone.utc).isoformat()
     
-    def to_sse(self) -> str:
+    def to_sse(self) -> bytes:
         """Format as Server-Sent Event message."""
-        json_data = json.dumps({
+        return encode_sse({
             "event": self.event_type.value,
             "timestamp": self.timestamp,
             **self.data
         })
-        return f"data: {json_data}\n\n"
     
 # ===== EVENT FACTORY FUNCTIONS =====
 
@@ -4,6 +4,8 @@ Task Identifier
 Uses an LLM to identify what type of coding task the user is requesting.
 """
 
+import re
+
 from app.core.base_llm import BaseLLMClient
 from app.core.task_state import TaskState, TaskType
 from app.classifier.prompts import (
@@ -12,6 +14,10 @@ from app.classifier.prompts import (
     CAN_HANDLE_TEMPLATE,
 )
 
+# Prebuilt lookups so classification is a single regex scan
+_NAME_TO_TYPE: dict[str, TaskType] = {t.name: t for t in TaskType}
+_TASK_TYPE_PATTERN = re.compile("|".join(re.escape(name) for name in _NAME_TO_TYPE))
+
 
 class TaskIdentifier:
     """
@@ -57,8 +63,13 @@ class TaskIdentifier:
         """Parse LLM response into TaskType enum."""
         cleaned = response.strip().upper().replace(" ", "_")
         
-        for task_type in TaskType:
-            if task_type.name in cleaned or cleaned in task_type.name:
+        match = _TASK_TYPE_PATTERN.search(cleaned)
+        if match:
+            return _NAME_TO_TYPE[match.group()]
+        
+        # Partial answers (e.g. "FIX") map to the type name containing them
+        for name, task_type in _NAME_TO_TYPE.items():
+            if cleaned in name:
                 return task_type
         
         return TaskType.CODE_GENERATION
\ No newline at end of file
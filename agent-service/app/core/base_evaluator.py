@@ -10,7 +10,7 @@ from dataclasses import dataclass
 from app.core.task_state import TaskState
 
 
-@dataclass
+@dataclass(slots=True)
 class EvaluationResult:
     """Result of evaluating agent output."""
     score: float  # 0.0 to 1.0
@@ -8,10 +8,10 @@ can wrap OpenAI, Anthropic, local models, or any other LLM.
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Optional
+from typing import AsyncIterator, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class LLMResponse:
     """
     Standardized response from any LLM provider.
@@ -24,17 +24,29 @@ class LLMResponse:
     prompt_tokens: int
     completion_tokens: int
     total_tokens: int
+    # Prompt-cache accounting (subset of prompt_tokens, 0 if unsupported)
+    cache_read_input_tokens: int = 0
+    cache_creation_input_tokens: int = 0
     
     @property
     def cost_estimate(self) -> float:
         """
         Rough cost estimate in USD.
         
+        Cache reads are billed at ~10% and cache writes at ~125%
+        of the normal input rate, matching provider prompt caching.
+        
         Override in provider-specific implementations for
         accurate pricing.
         """
         # Default estimate: $0.01 per 1K tokens
-        return (self.total_tokens / 1000) * 0.01
+        cached = self.cache_read_input_tokens + self.cache_creation_input_tokens
+        billable = (
+            self.total_tokens - cached
+            + self.cache_read_input_tokens * 0.1
+            + self.cache_creation_input_tokens * 1.25
+        )
+        return (billable / 1000) * 0.01
 
 
 class BaseLLMClient(ABC):
@@ -107,6 +119,27 @@ class BaseLLMClient(ABC):
         """
         pass
     
+    async def generate_stream(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        temperature: float = 0.7,
+        max_tokens: int = 2000,
+    ) -> AsyncIterator[str]:
+        """
+        Stream a completion as content chunks.
+        
+        Default implementation yields the full generate() result as a
+        single chunk; providers with native streaming should override.
+        """
+        response = await self.generate(
+            prompt,
+            system_prompt=system_prompt,
+            temperature=temperature,
+            max_tokens=max_tokens,
+        )
+        yield response.content
+    
     @abstractmethod
     def get_model_name(self) -> str:
         """Return the model identifier (e.g., 'gpt-4', 'claude-3-opus')."""
@@ -4,7 +4,9 @@ Task State Definition
 State of a task as it flows through the code agent workflow.
 """
 
-from dataclasses import dataclass, field
+import hashlib
+import time
+from dataclasses import dataclass, field, replace
 from enum import Enum
 from typing import Optional
 from datetime import datetime, timezone
@@ -29,7 +31,7 @@ class TaskStatus(str, Enum):
     FAILED = "failed"             # Failed permanently (terminal)
 
 
-@dataclass
+@dataclass(slots=True)
 class TaskState:
     """State of a single task flowing through the workflow."""
     
@@ -57,17 +59,67 @@ class TaskState:
     # Error handling
     error_message: Optional[str] = None
     
-    # Metadata
-    created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
-    updated_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    # Metadata (epoch seconds; see *_dt properties for datetimes)
+    created_at: float = field(default_factory=time.time)
+    updated_at: float = field(default_factory=time.time)
+    
+    # Lazily computed by context_hash; reset by with_updates and whenever
+    # context is assigned (init=False)
+    _context_hash: Optional[str] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    
+    @property
+    def context_hash(self) -> Optional[str]:
+        """SHA-256 of context, computed once per state and reused by cache keys."""
+        if self._context_hash is None and self.context:
+            self._context_hash = hashlib.sha256(self.context.encode()).hexdigest()
+        return self._context_hash
+    
+    def __setattr__(self, name: str, value: object) -> None:
+        # TaskState is mutable, so drop the memoized hash when context changes
+        if name == "context":
+            object.__setattr__(self, "_context_hash", None)
+        object.__setattr__(self, name, value)
+    
+    @property
+    def created_at_dt(self) -> datetime:
+        """created_at as a timezone-aware UTC datetime."""
+        return datetime.fromtimestamp(self.created_at, tz=timezone.utc)
+    
+    @property
+    def updated_at_dt(self) -> datetime:
+        """updated_at as a timezone-aware UTC datetime."""
+        return datetime.fromtimestamp(self.updated_at, tz=timezone.utc)
     
     def with_updates(self, **kwargs) -> "TaskState":
         """Create a new state with updated fields."""
-        from dataclasses import asdict
-        current = asdict(self)
-        current.update(kwargs)
-        current["updated_at"] = datetime.now(timezone.utc)  # Updated timestamp
-        return TaskState(**current)
+        kwargs["updated_at"] = time.time()  # Updated timestamp
+        return replace(self, **kwargs)
+    
+    def to_dict(self) -> dict:
+        """
+        Convert to dictionary for serialization (checkpoints, persistence).
+        
+        Built by hand rather than with dataclasses.asdict to avoid its
+        recursive deep copy; test_results is shared, not copied.
+        """
+        return {
+            "task_id": self.task_id,
+            "task_type": self.task_type.value,
+            "input_description": self.input_description,
+            "context": self.context,
+            "generated_code": self.generated_code,
+            "test_results": self.test_results,
+            "evaluation_score": self.evaluation_score,
+            "evaluation_feedback": self.evaluation_feedback,
+            "status": self.status.value,
+            "retry_count": self.retry_count,
+            "max_retries": self.max_retries,
+            "error_message": self.error_message,
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
+        }
     
     def is_retriable(self) -> bool:
         """Check if the task can be retried."""
@@ -6,10 +6,44 @@ Fast first-pass check before more expensive evaluations.
 """
 
 import ast
+from functools import lru_cache
 from app.core.base_evaluator import BaseEvaluator, EvaluationResult
 from app.core.task_state import TaskState
 
 
+_BRACKET_PAIRS = (("(", ")"), ("[", "]"), ("{", "}"))
+
+
+def _has_unbalanced_brackets(code: str) -> bool:
+    """
+    Cheap pre-check for truncated output, done with C-level str.count.
+
+    Only trusted when the code has no strings or comments, where a
+    bracket inside a literal could skew the counts. Otherwise returns
+    False and leaves the verdict to ast.parse.
+    """
+    if "'" in code or '"' in code or "#" in code:
+        return False
+    return any(code.count(o) != code.count(c) for o, c in _BRACKET_PAIRS)
+
+
+@lru_cache(maxsize=512)
+def _check_syntax(code: str) -> tuple[bool, int | None, str | None]:
+    """
+    Parse code once per distinct source string.
+
+    Retry loops often resubmit identical code, so results are cached.
+
+    Returns:
+        (True, None, None) if valid, else (False, lineno, msg)
+    """
+    try:
+        ast.parse(code)
+        return True, None, None
+    except SyntaxError as e:
+        return False, e.lineno, e.msg
+
+
 class SyntaxEvaluator(BaseEvaluator):
     """
     Evaluates code by checking if it parses as valid Python.
@@ -30,23 +64,29 @@ class SyntaxEvaluator(BaseEvaluator):
         """
         code = state.generated_code
         
-        if not code or not code.strip():
+        if not code or code.isspace():
             return EvaluationResult(
                 score=0.0,
                 passed=False,
                 feedback="No code was generated"
             )
         
-        try:
-            ast.parse(code)
+        if _has_unbalanced_brackets(code):
+            return EvaluationResult(
+                score=0.0,
+                passed=False,
+                feedback="Syntax error: unbalanced brackets"
+            )
+        
+        valid, lineno, msg = _check_syntax(code)
+        if valid:
             return EvaluationResult(
                 score=1.0,
                 passed=True,
                 feedback="Code is syntactically valid"
             )
-        except SyntaxError as e:
-            return EvaluationResult(
-                score=0.0,
-                passed=False,
-                feedback=f"Syntax error at line {e.lineno}: {e.msg}"
-            )
\ No newline at end of file
+        return EvaluationResult(
+            score=0.0,
+            passed=False,
+            feedback=f"Syntax error at line {lineno}: {msg}"
+        )
\ No newline at end of file
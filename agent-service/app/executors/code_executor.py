@@ -4,7 +4,11 @@ Code Executor
 Calls the LLM to generate/modify code based on task type.
 """
 
-from app.core.base_llm import BaseLLMClient
+import asyncio
+import re
+from typing import Callable
+
+from app.core.base_llm import BaseLLMClient, LLMResponse
 from app.core.task_state import TaskState, TaskType, TaskStatus
 from app.executors.prompts import (
     CODE_GENERATION_SYSTEM, CODE_GENERATION_TEMPLATE,
@@ -14,6 +18,48 @@ from app.executors.prompts import (
     CODE_REVIEW_SYSTEM, CODE_REVIEW_TEMPLATE,
     format_context_section,
 )
+from app.llm.cache import LLMCache
+
+# Match ```python ... ``` or ``` ... ```
+_CODE_BLOCK_PATTERN = re.compile(r'```(?:python)?\n?(.*?)```', re.DOTALL)
+
+
+# ===== PROMPT BUILDERS =====
+# Templates are split around their placeholders once at import, so building
+# a prompt is a plain join instead of a str.format parse per call.
+
+_GEN_HEAD, _GEN_MID, _GEN_TAIL = re.split(
+    r"\{user_input\}|\{context_section\}", CODE_GENERATION_TEMPLATE
+)
+
+
+def _split_context_template(template: str) -> tuple[str, str, str]:
+    """Split a '{context} ... {user_input}' template into its literal parts."""
+    head, rest = template.split("{context}")
+    mid, tail = rest.split("{user_input}")
+    return head, mid, tail
+
+
+def _build_generation(state: TaskState) -> str:
+    return "".join((
+        _GEN_HEAD, state.input_description,
+        _GEN_MID, format_context_section(state.context),
+        _GEN_TAIL,
+    ))
+
+
+def _context_builder(template: str) -> Callable[[TaskState], str]:
+    """Make a builder for templates that embed existing code then the request."""
+    head, mid, tail = _split_context_template(template)
+
+    def build(state: TaskState) -> str:
+        return "".join((
+            head, state.context or "No code provided",
+            mid, state.input_description,
+            tail,
+        ))
+
+    return build
 
 
 class CodeExecutor:
@@ -24,17 +70,31 @@ class CodeExecutor:
     and returns updated state with generated code.
     """
     
-    # Map task types to their prompts
-    PROMPTS: dict[TaskType, tuple[str, str]] = {
-        TaskType.CODE_GENERATION: (CODE_GENERATION_SYSTEM, CODE_GENERATION_TEMPLATE),
-        TaskType.CODE_FIX: (CODE_FIX_SYSTEM, CODE_FIX_TEMPLATE),
-        TaskType.CODE_REFACTOR: (CODE_REFACTOR_SYSTEM, CODE_REFACTOR_TEMPLATE),
-        TaskType.CODE_TESTING: (CODE_TESTING_SYSTEM, CODE_TESTING_TEMPLATE),
-        TaskType.CODE_REVIEW: (CODE_REVIEW_SYSTEM, CODE_REVIEW_TEMPLATE),
+    # Map task types to their system prompt and prompt builder
+    PROMPTS: dict[TaskType, tuple[str, Callable[[TaskState], str]]] = {
+        TaskType.CODE_GENERATION: (CODE_GENERATION_SYSTEM, _build_generation),
+        TaskType.CODE_FIX: (CODE_FIX_SYSTEM, _context_builder(CODE_FIX_TEMPLATE)),
+        TaskType.CODE_REFACTOR: (
+            CODE_REFACTOR_SYSTEM, _context_builder(CODE_REFACTOR_TEMPLATE)
+        ),
+        TaskType.CODE_TESTING: (
+            CODE_TESTING_SYSTEM, _context_builder(CODE_TESTING_TEMPLATE)
+        ),
+        TaskType.CODE_REVIEW: (
+            CODE_REVIEW_SYSTEM, _context_builder(CODE_REVIEW_TEMPLATE)
+        ),
     }
     
-    def __init__(self, llm_client: BaseLLMClient):
+    def __init__(
+        self,
+        llm_client: BaseLLMClient,
+        temperature: float = 0.7,
+        cache: LLMCache | None = None,
+    ):
         self.llm_client = llm_client
+        self.temperature = temperature
+        # Only consulted for deterministic (temperature=0) calls
+        self.cache = cache
     
     async def execute(self, state: TaskState) -> TaskState:
         """
@@ -46,46 +106,83 @@ class CodeExecutor:
         Returns:
             Updated state with generated_code populated
         """
-        system_prompt, template = self.PROMPTS[state.task_type]
+        system_prompt, build_prompt = self.PROMPTS[state.task_type]
         
-        # Build the prompt
-        if state.task_type == TaskType.CODE_GENERATION:
-                prompt = template.format(
-                    user_input=state.input_description,
-                    context_section=format_context_section(state.context),
-                )
-
+        # With context, the raw request is sent and the code goes in its
+        # own message; otherwise build the full templated prompt
+        if state.context:
+            prompt = state.input_description
         else:
-            prompt = template.format(
-                user_input=state.input_description,
-                existing_code=state.context or "No code provided",
-            )
+            prompt = build_prompt(state)
 
-        # Call LLM
-        if state.context:
-            response = await self.llm_client.generate_with_context(
-                prompt=state.input_description,
-                context=state.context,
+        # Call LLM (or reuse a cached deterministic response)
+        if self.cache is not None and LLMCache.is_cacheable(self.temperature):
+            cache_key = LLMCache.make_key(
+                model=self.llm_client.get_model_name(),
                 system_prompt=system_prompt,
-            )
-        else:
-            response = await self.llm_client.generate(
                 prompt=prompt,
-                system_prompt=system_prompt,
+                context_hash=state.context_hash,
+                temperature=self.temperature,
             )
+            response = await self.cache.get(cache_key)
+            if response is None:
+                response = await self._call_llm(prompt, state.context, system_prompt)
+                await self.cache.set(cache_key, response)
+        else:
+            response = await self._call_llm(prompt, state.context, system_prompt)
         
         # Return updated state
         return state.with_updates(
             status=TaskStatus.EVALUATING,
             generated_code=strip_markdown_code_blocks(response.content),
         )
+    
+    async def execute_many(
+        self,
+        states: list[TaskState],
+        max_concurrency: int = 16,
+    ) -> list[TaskState]:
+        """
+        Execute several tasks concurrently over the shared LLM client.
+        
+        Args:
+            states: Task states to execute
+            max_concurrency: Maximum in-flight LLM calls
+            
+        Returns:
+            Updated states, in the same order as the input
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def _bounded(state: TaskState) -> TaskState:
+            async with semaphore:
+                return await self.execute(state)
+        
+        return await asyncio.gather(*[_bounded(s) for s in states])
+    
+    async def _call_llm(
+        self,
+        prompt: str,
+        context: str | None,
+        system_prompt: str,
+    ) -> LLMResponse:
+        """Call the LLM, passing context separately when present."""
+        if context:
+            return await self.llm_client.generate_with_context(
+                prompt=prompt,
+                context=context,
+                system_prompt=system_prompt,
+                temperature=self.temperature,
+            )
+        return await self.llm_client.generate(
+            prompt=prompt,
+            system_prompt=system_prompt,
+            temperature=self.temperature,
+        )
 
 def strip_markdown_code_blocks(text: str) -> str:
     """Remove markdown code blocks from LLM response."""
-    import re
-    # Match ```python ... ``` or ``` ... ```
-    pattern = r'```(?:python)?\n?(.*?)```'
-    matches = re.findall(pattern, text, re.DOTALL)
-    if matches:
-        return matches[0].strip()
+    match = _CODE_BLOCK_PATTERN.search(text)
+    if match:
+        return match.group(1).strip()
     return text.strip()
\ No newline at end of file
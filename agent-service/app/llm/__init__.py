@@ -1,23 +1,36 @@
 """LLM Client Factory and Registry"""
 
 import os
+import re
 from pathlib import Path
 
 from .registry import LLMRegistry, get_registry, reset_registry
 
+# Resolved once; .env lives at the project root
+_ENV_PATH = Path(__file__).parent.parent.parent.parent / ".env"
+_ENV_LOADED = False
+
+# KEY=value lines; comments and lines without "=" never match
+_ENV_LINE_PATTERN = re.compile(r"^[ \t]*([^#\s=][^=\n]*?)[ \t]*=(.*)$", re.MULTILINE)
+
 
 def _load_env():
-    """Load .env file from project root."""
-    env_path = Path(__file__).parent.parent.parent.parent / ".env"
+    """
+    Load .env file from project root, OVERRIDING existing variables.
+
+    Runs once per process; later calls are no-ops so client modules
+    don't re-read the file on import.
+    """
+    global _ENV_LOADED
+    if _ENV_LOADED:
+        return
+    _ENV_LOADED = True
 
-    if env_path.exists():
-        with open(env_path) as f:
-            for line in f:
-                line = line.strip()
-                if "=" in line and not line.startswith("#"):
-                    key, value = line.split("=", 1)
-                    value = value.strip().strip('"').strip("'")
-                    os.environ[key] = value
+    if _ENV_PATH.exists():
+        os.environ.update({
+            key: value.strip().strip('"').strip("'")
+            for key, value in _ENV_LINE_PATTERN.findall(_ENV_PATH.read_text())
+        })
 
 
 _load_env()
@@ -29,6 +42,7 @@ def get_llm_client():
 
     Environment variables:
     - USE_MOCK_LLM=true: Use mock client (no API calls)
+    - MOCK_LLM_LATENCY_MS: Simulated latency per mock call (default: 0)
     - LLM_PROVIDER=openrouter: Use OpenRouter (default if OPENROUTER_API_KEY set)
     - LLM_PROVIDER=grok: Use xAI Grok
     - OPENROUTER_MODEL: Model to use with OpenRouter (default: anthropic/claude-3.5-sonnet)
@@ -41,7 +55,7 @@ def get_llm_client():
     if use_mock:
         from app.llm.mock_client import MockLLMClient
         print("🧪 Using MOCK LLM Client (no API calls)")
-        return MockLLMClient(latency_ms=100)
+        return MockLLMClient(latency_ms=float(os.getenv("MOCK_LLM_LATENCY_MS", "0")))
 
     # Determine provider
     provider = os.getenv("LLM_PROVIDER", "").lower()
@@ -0,0 +1,133 @@
+"""
+LLM Response Cache
+
+Caches deterministic (temperature=0) LLM responses so retries and
+repeated prompts skip the network round-trip and token spend.
+
+The cache talks to an async backend so the in-memory dict used in
+dev/test can be swapped for Redis (or anything with get/set) in prod.
+"""
+
+import hashlib
+import time
+from dataclasses import asdict
+from typing import Any, Optional, Protocol
+
+import orjson
+
+from app.core.base_llm import LLMResponse
+
+
+class CacheBackend(Protocol):
+    """Async key/value store used by LLMCache."""
+
+    async def get(self, key: str) -> Optional[dict[str, Any]]:
+        ...
+
+    async def set(self, key: str, value: dict[str, Any], ttl: int) -> None:
+        ...
+
+
+class InMemoryBackend:
+    """
+    Process-local backend with per-entry expiry. Suitable for dev/tests.
+
+    Args:
+        maxsize: Evict the oldest entry once this many are stored
+            (default: unbounded)
+    """
+
+    def __init__(self, maxsize: Optional[int] = None):
+        self._store: dict[str, tuple[float, dict[str, Any]]] = {}
+        self.maxsize = maxsize
+
+    async def get(self, key: str) -> Optional[dict[str, Any]]:
+        entry = self._store.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            del self._store[key]
+            return None
+        return value
+
+    async def set(self, key: str, value: dict[str, Any], ttl: int) -> None:
+        if (
+            self.maxsize is not None
+            and key not in self._store
+            and len(self._store) >= self.maxsize
+        ):
+            # Dicts keep insertion order, so the first key is the oldest
+            del self._store[next(iter(self._store))]
+        self._store[key] = (time.monotonic() + ttl, value)
+
+
+class LLMCache:
+    """
+    Cache of LLM responses keyed by a hash of the request.
+
+    Only deterministic calls should be cached; use is_cacheable()
+    before looking up or storing a response.
+
+    Args:
+        backend: Storage backend (default: InMemoryBackend)
+        ttl: Seconds to keep an entry (default: 1 hour)
+    """
+
+    def __init__(self, backend: Optional[CacheBackend] = None, ttl: int = 3600):
+        self.backend = backend or InMemoryBackend()
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def is_cacheable(temperature: float) -> bool:
+        """Only temperature=0 responses are reproducible enough to cache."""
+        return temperature == 0
+
+    @staticmethod
+    def make_key(
+        model: str,
+        system_prompt: Optional[str],
+        prompt: str,
+        context_hash: Optional[str],
+        temperature: float,
+    ) -> str:
+        """
+        SHA-256 of the request fields that determine the response.
+        
+        Context is passed pre-hashed (TaskState.context_hash) so large
+        code blocks are hashed once per task, not once per lookup.
+        """
+        return LLMCache.key_for_payload({
+            "model": model,
+            "system_prompt": system_prompt,
+            "prompt": prompt,
+            "context_hash": context_hash,
+            "temperature": temperature,
+        })
+
+    @staticmethod
+    def key_for_payload(payload: dict[str, Any]) -> str:
+        """SHA-256 of a canonicalized (sorted-key) JSON request payload."""
+        return hashlib.sha256(
+            orjson.dumps(payload, option=orjson.OPT_SORT_KEYS)
+        ).hexdigest()
+
+    async def get(self, key: str) -> Optional[LLMResponse]:
+        """Return the cached response, or None on a miss."""
+        data = await self.backend.get(key)
+        if data is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return LLMResponse(**data)
+
+    async def set(self, key: str, response: LLMResponse) -> None:
+        """Store a response under key."""
+        await self.backend.set(key, asdict(response), ttl=self.ttl)
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Hit/miss counters for observability."""
+        return {"hits": self.hits, "misses": self.misses}
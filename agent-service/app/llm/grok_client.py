@@ -6,26 +6,25 @@ Free API key at: https://console.x.ai/
 """
 
 import os
-from openai import AsyncOpenAI
+from typing import Any, AsyncIterator, cast
+
+from openai import AsyncStream
+from openai.types import CompletionUsage
+from openai.types.chat import ChatCompletionChunk, ChatCompletionMessageParam
+
 from app.core.base_llm import BaseLLMClient, LLMResponse
-from pathlib import Path
+from app.llm import _load_env
+from app.llm.http_client import get_openai_client
+from app.llm.messages import build_messages
+
+_load_env()  # no-op if the app.llm package already loaded it
 
-def load_env():
-    """Load .env file, OVERRIDING any existing environment variables."""
-    env_path = Path(__file__).parent.parent.parent.parent / ".env"
-    
-    if env_path.exists():
-        with open(env_path) as f:
-            for line in f:
-                line = line.strip()
-                if "=" in line and not line.startswith("#"):
-                    key, value = line.split("=", 1)
-                    # Remove quotes if present
-                    value = value.strip().strip('"').strip("'")
-                    # OVERRIDE existing value (not setdefault!)
-                    os.environ[key] = value
 
-load_env()
+def _cached_tokens(usage: CompletionUsage | None) -> int:
+    """Prompt tokens served from xAI's automatic prompt cache."""
+    details = getattr(usage, "prompt_tokens_details", None)
+    return (getattr(details, "cached_tokens", 0) or 0) if details else 0
+
 
 class GrokClient(BaseLLMClient):
     """
@@ -40,10 +39,9 @@ class GrokClient(BaseLLMClient):
         api_key = os.getenv("XAI_API_KEY")
         if not api_key:
             raise ValueError("XAI_API_KEY environment variable not set")
-        self.client = AsyncOpenAI(
-            api_key=api_key,
-            base_url="https://api.x.ai/v1",  # xAI's endpoint
-        )
+        # Shared per (api_key, base_url) on the process-wide keep-alive pool;
+        # points at xAI's endpoint
+        self.client = get_openai_client(api_key, "https://api.x.ai/v1")
     
     async def generate(
         self,
@@ -53,27 +51,9 @@ class GrokClient(BaseLLMClient):
         max_tokens: int = 2000,
     ) -> LLMResponse:
         """Generate a completion from Grok."""
-        messages = []
-        
-        if system_prompt:
-            messages.append({"role": "system", "content": system_prompt})
-        
-        messages.append({"role": "user", "content": prompt})
+        messages = build_messages(prompt, system_prompt)
         
-        response = await self.client.chat.completions.create(
-            model=self.model,
-            messages=messages,
-            temperature=temperature,
-            max_tokens=max_tokens,
-        )
-        
-        return LLMResponse(
-            content=response.choices[0].message.content or "",
-            model=self.model,
-            prompt_tokens=response.usage.prompt_tokens if response.usage else 0,
-            completion_tokens=response.usage.completion_tokens if response.usage else 0,
-            total_tokens=response.usage.total_tokens if response.usage else 0,
-        )
+        return await self._complete(messages, temperature, max_tokens)
     
     async def generate_with_context(
         self,
@@ -84,31 +64,61 @@ class GrokClient(BaseLLMClient):
         max_tokens: int = 2000,
     ) -> LLMResponse:
         """Generate with additional context."""
-        messages = []
-        
-        if system_prompt:
-            messages.append({"role": "system", "content": system_prompt})
+        messages = build_messages(prompt, system_prompt, context)
         
-        messages.append({
-            "role": "system",
-            "content": f"Reference code/context:\n\n{context}"
-        })
-        
-        messages.append({"role": "user", "content": prompt})
+        return await self._complete(messages, temperature, max_tokens)
+    
+    async def generate_stream(
+        self,
+        prompt: str,
+        system_prompt: str | None = None,
+        temperature: float = 0.7,
+        max_tokens: int = 2000,
+    ) -> AsyncIterator[str]:
+        """Yield content deltas from Grok as they arrive."""
+        messages = build_messages(prompt, system_prompt)
         
-        response = await self.client.chat.completions.create(
+        async for chunk in await self._stream(messages, temperature, max_tokens):
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+    
+    async def _stream(
+        self, messages: list[dict[str, Any]], temperature: float, max_tokens: int
+    ) -> AsyncStream[ChatCompletionChunk]:
+        """Open a streaming completion; the final chunk carries usage."""
+        return await self.client.chat.completions.create(
             model=self.model,
-            messages=messages,
+            # build_messages returns plain dicts, not the SDK's TypedDicts
+            messages=cast("list[ChatCompletionMessageParam]", messages),
             temperature=temperature,
             max_tokens=max_tokens,
+            stream=True,
+            stream_options={"include_usage": True},
         )
+    
+    async def _complete(
+        self,
+        messages: list[dict],
+        temperature: float,
+        max_tokens: int,
+    ) -> LLMResponse:
+        """Stream a completion and assemble it into an LLMResponse."""
+        parts: list[str] = []
+        usage = None
+        
+        async for chunk in await self._stream(messages, temperature, max_tokens):
+            if chunk.choices and chunk.choices[0].delta.content:
+                parts.append(chunk.choices[0].delta.content)
+            if chunk.usage:
+                usage = chunk.usage
         
         return LLMResponse(
-            content=response.choices[0].message.content or "",
+            content="".join(parts),
             model=self.model,
-            prompt_tokens=response.usage.prompt_tokens if response.usage else 0,
-            completion_tokens=response.usage.completion_tokens if response.usage else 0,
-            total_tokens=response.usage.total_tokens if response.usage else 0,
+            prompt_tokens=usage.prompt_tokens if usage else 0,
+            completion_tokens=usage.completion_tokens if usage else 0,
+            total_tokens=usage.total_tokens if usage else 0,
+            cache_read_input_tokens=_cached_tokens(usage),
         )
     
     def get_model_name(self) -> str:
@@ -0,0 +1,46 @@
+"""
+Shared HTTP Client
+
+One process-wide httpx.AsyncClient for all LLM clients, so every
+GrokClient/OpenRouterClient instance reuses the same warm keep-alive
+pool instead of paying a TCP+TLS handshake per instance. AsyncOpenAI
+wrappers are likewise shared per (api_key, base_url).
+"""
+
+from functools import lru_cache
+
+import httpx
+from openai import AsyncOpenAI
+
+_shared_http: httpx.AsyncClient | None = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Return the shared client, creating it on first use (or after close)."""
+    global _shared_http
+    if _shared_http is None or _shared_http.is_closed:
+        _shared_http = httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=64),
+            timeout=60.0,
+        )
+    return _shared_http
+
+
+@lru_cache(maxsize=8)
+def get_openai_client(api_key: str, base_url: str) -> AsyncOpenAI:
+    """Return one AsyncOpenAI per (api_key, base_url), on the shared pool."""
+    return AsyncOpenAI(
+        api_key=api_key,
+        base_url=base_url,
+        http_client=get_http_client(),
+    )
+
+
+async def close_http_client() -> None:
+    """Close the shared client. Called on application shutdown."""
+    global _shared_http
+    # Cached AsyncOpenAI instances hold the old client; drop them too
+    get_openai_client.cache_clear()
+    if _shared_http is not None:
+        await _shared_http.aclose()
+        _shared_http = None
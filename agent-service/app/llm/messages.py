@@ -0,0 +1,71 @@
+"""
+Chat Message Construction
+
+Shared by the OpenAI-compatible clients (Grok, OpenRouter) so the
+system prompt / context / user prompt layout is defined once.
+"""
+
+from functools import lru_cache
+
+
+@lru_cache(maxsize=64)
+def _prefix_messages(
+    system_prompt: str | None,
+    context: str | None,
+    cache_system: bool,
+) -> tuple[dict, ...]:
+    """
+    Build the leading system messages once per (system, context) pair.
+
+    The returned dicts are shared between calls and must not be mutated.
+    """
+    prefix = []
+    if system_prompt:
+        if cache_system:
+            prefix.append({
+                "role": "system",
+                "content": [{
+                    "type": "text",
+                    "text": system_prompt,
+                    "cache_control": {"type": "ephemeral"},
+                }],
+            })
+        else:
+            prefix.append({"role": "system", "content": system_prompt})
+
+    if context is not None:
+        prefix.append(
+            {"role": "system", "content": f"Reference code/context:\n\n{context}"}
+        )
+
+    return tuple(prefix)
+
+
+def build_messages(
+    prompt: str,
+    system_prompt: str | None = None,
+    context: str | None = None,
+    cache_system: bool = False,
+) -> list[dict]:
+    """
+    Build the chat messages for a completion request.
+
+    The invariant system prompt always comes first and the volatile
+    context after it, so the provider's cacheable prefix is maximal.
+    Only the user message is allocated per call; the system/context
+    messages come from a small cache.
+
+    Args:
+        prompt: The user prompt
+        system_prompt: Optional system instructions
+        context: Optional reference code/context
+        cache_system: Mark the system prompt with an explicit
+            cache_control breakpoint (needed for Anthropic models)
+
+    Returns:
+        List of message dicts
+    """
+    return [
+        *_prefix_messages(system_prompt, context, cache_system),
+        {"role": "user", "content": prompt},
+    ]
@@ -6,16 +6,20 @@ Enable with: USE_MOCK_LLM=true
 """
 
 import asyncio
+import re
+from functools import lru_cache
+from types import MappingProxyType
 from app.core.base_llm import BaseLLMClient, LLMResponse
 
 
-MOCK_RESPONSES = {
+MOCK_RESPONSES = MappingProxyType({
     "identify": "CODE_GENERATION",
     "can_handle": "YES",
-}
+})
 
-# Task-specific mock code responses
-MOCK_CODE_RESPONSES = {
+# Task-specific mock code responses (read-only; keys are
+# literals, so already interned and compared by identity first)
+MOCK_CODE_RESPONSES = MappingProxyType({
     "snake": '''"""Snake Game - A classic arcade game implementation."""
 import random
 
@@ -348,63 +352,155 @@ if __name__ == "__main__":
     print(hello_world())
     print(hello_world("Developer"))
 ''',
+})
+
+
+# ===== PROMPT CLASSIFICATION =====
+# One case-insensitive scan per prompt instead of lower() + a chain of
+# substring tests. Group names are listed in priority order; when several
+# keywords appear, the highest-priority one wins (as the old if/elif did).
+
+_PROMPT_KIND_PATTERN = re.compile(
+    r"(?P<planner>break it into)"
+    r"|(?P<can_handle>yes or no|can you handle)"
+    r"|(?P<identify>classify|task type)",
+    re.IGNORECASE,
+)
+_PLANNER_SYSTEM_PATTERN = re.compile(r"software architect", re.IGNORECASE)
+
+_CODE_KEYWORD_PATTERN = re.compile(
+    r"(?P<snake>snake)"
+    r"|(?P<calculator>calculator)"
+    r"|(?P<todo>todo)"
+    r"|(?P<api>api|crud|rest)"
+    r"|(?P<fibonacci>fib)",
+    re.IGNORECASE,
+)
+
+_PLAN_KEYWORD_PATTERN = re.compile(
+    r"(?P<snake>snake)|(?P<calculator>calculator)|(?P<todo>todo)|(?P<api>api)",
+    re.IGNORECASE,
+)
+_TASK_LINE_PATTERN = re.compile(
+    r"^[^\S\n]*task:[^\S\n]*(.*?)[^\S\n]*$", re.IGNORECASE | re.MULTILINE
+)
+_PLAN_TASKS = {
+    "snake": "snake game",
+    "calculator": "calculator",
+    "todo": "todo app",
+    "api": "api",
 }
 
 
+def _classify(pattern: re.Pattern, text: str) -> str | None:
+    """Return the highest-priority group name matched anywhere in text."""
+    groups = pattern.groupindex
+    top = next(iter(groups))
+    found = set()
+    for match in pattern.finditer(text):
+        if match.lastgroup == top:
+            return top  # Nothing can outrank it; stop scanning
+        found.add(match.lastgroup)
+    if not found:
+        return None
+    return next(name for name in groups if name in found)
+
+
+@lru_cache(maxsize=128)
+def _count_tokens(text: str) -> int:
+    """Whitespace token count, memoized since responses are canned strings."""
+    return len(text.split())
+
+
 def _get_mock_code(prompt: str) -> str:
     """Get task-specific mock code based on prompt keywords."""
-    prompt_lower = prompt.lower()
+    key = _classify(_CODE_KEYWORD_PATTERN, prompt)
+    return MOCK_CODE_RESPONSES[key or "default"]
 
-    if "snake" in prompt_lower:
-        return MOCK_CODE_RESPONSES["snake"]
-    elif "calculator" in prompt_lower:
-        return MOCK_CODE_RESPONSES["calculator"]
-    elif "todo" in prompt_lower:
-        return MOCK_CODE_RESPONSES["todo"]
-    elif "api" in prompt_lower or "crud" in prompt_lower or "rest" in prompt_lower:
-        return MOCK_CODE_RESPONSES["api"]
-    elif "fibonacci" in prompt_lower or "fib" in prompt_lower:
-        return MOCK_CODE_RESPONSES["fibonacci"]
 
-    return MOCK_CODE_RESPONSES["default"]
+def _get_mock_plan_response(task: str) -> str:
+    """
+    Resolve get_mock_plan_response on first use.
+
+    Importing app.agents at module load would be circular, so the first
+    call imports it and rebinds this module-level name to the real
+    function; later calls go straight to it.
+    """
+    global _get_mock_plan_response
+    from app.agents.planner.mock_responses import get_mock_plan_response
+
+    _get_mock_plan_response = get_mock_plan_response
+    return get_mock_plan_response(task)
 
 
 def _get_planner_response(prompt: str) -> str:
     """Get mock planner response based on task in prompt."""
-    # Import here to avoid circular imports
-    from app.agents.planner.mock_responses import get_mock_plan_response
-
     # Extract task from prompt (look for "Task:" line)
-    prompt_lower = prompt.lower()
-    for line in prompt.split("\n"):
-        if line.strip().lower().startswith("task:"):
-            task = line.split(":", 1)[1].strip()
-            return get_mock_plan_response(task)
+    match = _TASK_LINE_PATTERN.search(prompt)
+    if match:
+        return _get_mock_plan_response(match.group(1))
 
     # Fallback: look for keywords
-    if "snake" in prompt_lower:
-        return get_mock_plan_response("snake game")
-    elif "calculator" in prompt_lower:
-        return get_mock_plan_response("calculator")
-    elif "todo" in prompt_lower:
-        return get_mock_plan_response("todo app")
-    elif "api" in prompt_lower:
-        return get_mock_plan_response("api")
-
-    # Default fallback
-    return get_mock_plan_response("unknown task")
+    key = _classify(_PLAN_KEYWORD_PATTERN, prompt)
+    return _get_mock_plan_response(_PLAN_TASKS[key] if key else "unknown task")
+
+
+@lru_cache(maxsize=512)
+def _build_response(prompt: str, system_prompt: str | None) -> LLMResponse:
+    """
+    Build the mock response for a prompt.
+
+    Pure function of its inputs, so identical calls share one
+    LLMResponse instead of re-classifying and re-counting tokens.
+    Callers must treat the returned response as read-only.
+    """
+    kind = _classify(_PROMPT_KIND_PATTERN, prompt)
+
+    # Check for planner prompts
+    if kind == "planner" or (
+        system_prompt and _PLANNER_SYSTEM_PATTERN.search(system_prompt)
+    ):
+        content = _get_planner_response(prompt)
+    elif kind is not None:
+        content = MOCK_RESPONSES[kind]
+    else:
+        # Get task-specific mock code
+        content = _get_mock_code(prompt)
+
+    prompt_tokens = len(prompt.split())
+    completion_tokens = _count_tokens(content)
+
+    return LLMResponse(
+        content=content,
+        model="mock-llm",
+        prompt_tokens=prompt_tokens,
+        completion_tokens=completion_tokens,
+        total_tokens=prompt_tokens + completion_tokens,
+    )
 
 
 class MockLLMClient(BaseLLMClient):
     """Mock LLM client for testing."""
 
-    def __init__(self, latency_ms: float = 100):
+    # Reset memoized responses (e.g. between tests)
+    clear_cache = staticmethod(_build_response.cache_clear)
+
+    def __init__(self, latency_ms: float = 0, yield_only: bool = False):
+        """
+        Args:
+            latency_ms: Simulated network latency per call (0 = none)
+            yield_only: With no latency, still yield to the event loop
+                once per call (sleep(0), no timer) to keep interleaving
+        """
         self.latency_ms = latency_ms
+        self.yield_only = yield_only
         self.call_count = 0  # Track calls for testing
 
     async def _simulate_latency(self):
         if self.latency_ms > 0:
             await asyncio.sleep(self.latency_ms / 1000)
+        elif self.yield_only:
+            await asyncio.sleep(0)
 
     async def generate(
         self,
@@ -416,30 +512,7 @@ class MockLLMClient(BaseLLMClient):
         await self._simulate_latency()
         self.call_count += 1
 
-        prompt_lower = prompt.lower()
-        system_lower = (system_prompt or "").lower()
-
-        # Check for planner prompts
-        if "software architect" in system_lower or "break it into" in prompt_lower:
-            content = _get_planner_response(prompt)
-        elif "yes or no" in prompt_lower or "can you handle" in prompt_lower:
-            content = MOCK_RESPONSES["can_handle"]
-        elif "classify" in prompt_lower or "task type" in prompt_lower:
-            content = MOCK_RESPONSES["identify"]
-        else:
-            # Get task-specific mock code
-            content = _get_mock_code(prompt)
-
-        prompt_tokens = len(prompt.split())
-        completion_tokens = len(content.split())
-
-        return LLMResponse(
-            content=content,
-            model="mock-llm",
-            prompt_tokens=prompt_tokens,
-            completion_tokens=completion_tokens,
-            total_tokens=prompt_tokens + completion_tokens,
-        )
+        return _build_response(prompt, system_prompt)
 
     async def generate_with_context(
         self,
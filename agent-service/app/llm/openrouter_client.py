@@ -15,29 +15,38 @@ Popular models:
 - google/gemini-pro-1.5
 """
 
+import asyncio
 import os
 import time
-from openai import AsyncOpenAI
+from typing import Any, AsyncIterator, cast
+
+from openai import AsyncStream
+from openai.types import CompletionUsage
+from openai.types.chat import ChatCompletionChunk, ChatCompletionMessageParam
+
 from app.core.base_llm import BaseLLMClient, LLMResponse
+from app.llm import _load_env
+from app.llm.cache import InMemoryBackend, LLMCache
+from app.llm.http_client import get_openai_client
+from app.llm.messages import build_messages
 from app.logging_utils import log_llm_request, log_llm_response
-from pathlib import Path
-
 
-def load_env():
-    """Load .env file, OVERRIDING any existing environment variables."""
-    env_path = Path(__file__).parent.parent.parent.parent / ".env"
+_load_env()  # no-op if the app.llm package already loaded it
 
-    if env_path.exists():
-        with open(env_path) as f:
-            for line in f:
-                line = line.strip()
-                if "=" in line and not line.startswith("#"):
-                    key, value = line.split("=", 1)
-                    value = value.strip().strip('"').strip("'")
-                    os.environ[key] = value
+# Exact-match cache of deterministic (temperature=0) responses, shared by
+# all instances. Disable with OPENROUTER_CACHE_DISABLE=1.
+_RESPONSE_CACHE = LLMCache(backend=InMemoryBackend(maxsize=1024), ttl=3600)
 
 
-load_env()
+def _cache_usage(usage: CompletionUsage | None) -> tuple[int, int]:
+    """Return (cache_read, cache_creation) prompt tokens from a usage block."""
+    details = getattr(usage, "prompt_tokens_details", None)
+    if not details:
+        return 0, 0
+    return (
+        getattr(details, "cached_tokens", 0) or 0,
+        getattr(details, "cache_write_tokens", 0) or 0,
+    )
 
 
 class OpenRouterClient(BaseLLMClient):
@@ -60,11 +69,16 @@ class OpenRouterClient(BaseLLMClient):
                 "OPENROUTER_API_KEY environment variable not set. "
                 "Get your key at https://openrouter.ai/keys"
             )
-        self.client = AsyncOpenAI(
-            api_key=api_key,
-            base_url="https://openrouter.ai/api/v1",
-        )
+        # Shared per (api_key, base_url) on the process-wide keep-alive pool
+        self.client = get_openai_client(api_key, "https://openrouter.ai/api/v1")
         self._call_count = 0
+        # Anthropic models need an explicit cache breakpoint; others cache automatically
+        self._explicit_cache = model.startswith("anthropic/")
+        self._response_cache = (
+            None if os.getenv("OPENROUTER_CACHE_DISABLE") == "1" else _RESPONSE_CACHE
+        )
+        # Deterministic requests currently on the wire, by cache key
+        self._inflight: dict[str, asyncio.Task] = {}
 
     async def generate(
         self,
@@ -77,49 +91,33 @@ class OpenRouterClient(BaseLLMClient):
         self._call_count += 1
         call_id = self._call_count
 
-        messages = []
-
-        if system_prompt:
-            messages.append({"role": "system", "content": system_prompt})
-
-        messages.append({"role": "user", "content": prompt})
+        messages = build_messages(
+            prompt, system_prompt, cache_system=self._explicit_cache
+        )
 
         # Log the request
         log_llm_request(
             agent_name=self.model,
             purpose=f"LLM call #{call_id}",
             prompt_preview=prompt,
-            system_preview=system_prompt[:200] if system_prompt else None,
+            system_preview=system_prompt,
         )
 
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
 
-        response = await self.client.chat.completions.create(
-            model=self.model,
-            messages=messages,
-            temperature=temperature,
-            max_tokens=max_tokens,
-        )
+        response = await self._complete(messages, temperature, max_tokens)
 
-        duration_ms = (time.time() - start_time) * 1000
-        content = response.choices[0].message.content or ""
-        total_tokens = response.usage.total_tokens if response.usage else 0
+        duration_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
 
         # Log the response
         log_llm_response(
             agent_name=self.model,
-            response_preview=content,
-            tokens=total_tokens,
+            response_preview=response.content,
+            tokens=response.total_tokens,
             duration_ms=duration_ms,
         )
 
-        return LLMResponse(
-            content=content,
-            model=self.model,
-            prompt_tokens=response.usage.prompt_tokens if response.usage else 0,
-            completion_tokens=response.usage.completion_tokens if response.usage else 0,
-            total_tokens=total_tokens,
-        )
+        return response
 
     async def generate_with_context(
         self,
@@ -130,31 +128,117 @@ class OpenRouterClient(BaseLLMClient):
         max_tokens: int = 2000,
     ) -> LLMResponse:
         """Generate with additional context."""
-        messages = []
+        messages = build_messages(
+            prompt, system_prompt, context, cache_system=self._explicit_cache
+        )
 
-        if system_prompt:
-            messages.append({"role": "system", "content": system_prompt})
+        return await self._complete(messages, temperature, max_tokens)
 
-        messages.append({
-            "role": "system",
-            "content": f"Reference code/context:\n\n{context}"
+    async def _complete(
+        self,
+        messages: list[dict],
+        temperature: float,
+        max_tokens: int,
+    ) -> LLMResponse:
+        """
+        Call the API, deduplicating deterministic (temperature=0) requests.
+
+        Identical deterministic requests are served from the response
+        cache, and concurrent ones share a single in-flight API call.
+        """
+        if not LLMCache.is_cacheable(temperature):
+            return await self._request(messages, temperature, max_tokens)
+
+        key = LLMCache.key_for_payload({
+            "model": self.model,
+            "messages": messages,
+            "temperature": temperature,
+            "max_tokens": max_tokens,
         })
+        if self._response_cache is not None:
+            response = await self._response_cache.get(key)
+            if response is not None:
+                return response
+
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(
+                self._request_and_cache(key, messages, temperature, max_tokens)
+            )
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+
+        # Shield so one caller cancelling doesn't cancel the call for the others
+        return await asyncio.shield(task)
 
-        messages.append({"role": "user", "content": prompt})
+    async def _request_and_cache(
+        self,
+        key: str,
+        messages: list[dict],
+        temperature: float,
+        max_tokens: int,
+    ) -> LLMResponse:
+        response = await self._request(messages, temperature, max_tokens)
+        if self._response_cache is not None:
+            await self._response_cache.set(key, response)
+        return response
 
-        response = await self.client.chat.completions.create(
+    async def generate_stream(
+        self,
+        prompt: str,
+        system_prompt: str | None = None,
+        temperature: float = 0.7,
+        max_tokens: int = 2000,
+    ) -> AsyncIterator[str]:
+        """Yield content deltas from OpenRouter as they arrive."""
+        messages = build_messages(
+            prompt, system_prompt, cache_system=self._explicit_cache
+        )
+
+        async for chunk in await self._stream(messages, temperature, max_tokens):
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+
+    async def _stream(
+        self, messages: list[dict[str, Any]], temperature: float, max_tokens: int
+    ) -> AsyncStream[ChatCompletionChunk]:
+        """Open a streaming completion; the final chunk carries usage."""
+        return await self.client.chat.completions.create(
             model=self.model,
-            messages=messages,
+            # build_messages returns plain dicts (cache_control isn't in the
+            # SDK's TypedDicts), so cast for the streaming overload
+            messages=cast("list[ChatCompletionMessageParam]", messages),
             temperature=temperature,
             max_tokens=max_tokens,
+            stream=True,
+            stream_options={"include_usage": True},
         )
 
+    async def _request(
+        self,
+        messages: list[dict],
+        temperature: float,
+        max_tokens: int,
+    ) -> LLMResponse:
+        """Stream a completion from OpenRouter and assemble an LLMResponse."""
+        parts: list[str] = []
+        usage = None
+
+        async for chunk in await self._stream(messages, temperature, max_tokens):
+            if chunk.choices and chunk.choices[0].delta.content:
+                parts.append(chunk.choices[0].delta.content)
+            if chunk.usage:
+                usage = chunk.usage
+        cache_read, cache_creation = _cache_usage(usage)
+
         return LLMResponse(
-            content=response.choices[0].message.content or "",
+            content="".join(parts),
             model=self.model,
-            prompt_tokens=response.usage.prompt_tokens if response.usage else 0,
-            completion_tokens=response.usage.completion_tokens if response.usage else 0,
-            total_tokens=response.usage.total_tokens if response.usage else 0,
+            prompt_tokens=usage.prompt_tokens if usage else 0,
+            completion_tokens=usage.completion_tokens if usage else 0,
+            total_tokens=usage.total_tokens if usage else 0,
+            cache_read_input_tokens=cache_read,
+            cache_creation_input_tokens=cache_creation,
         )
 
     def get_model_name(self) -> str:
@@ -17,6 +17,7 @@ Usage:
 """
 
 import os
+import threading
 from typing import Optional
 
 from app.core.base_llm import BaseLLMClient
@@ -67,17 +68,17 @@ class LLMRegistry:
         Raises:
             ValueError: If role not found and no "default" registered
         """
-        if role in self._clients:
-            return self._clients[role]
-
-        if "default" in self._clients:
-            return self._clients["default"]
-
-        available = list(self._clients.keys()) if self._clients else []
-        raise ValueError(
-            f"No LLM client registered for role '{role}' and no 'default' available. "
-            f"Available roles: {available}"
-        )
+        client = self._clients.get(role)
+        if client is None:
+            client = self._clients.get("default")
+            if client is None:
+                available = list(self._clients.keys()) if self._clients else []
+                raise ValueError(
+                    f"No LLM client registered for role '{role}' "
+                    f"and no 'default' available. "
+                    f"Available roles: {available}"
+                )
+        return client
 
     def list_roles(self) -> list[str]:
         """
@@ -99,6 +100,7 @@ class LLMRegistry:
 
 # Module-level singleton
 _registry: Optional[LLMRegistry] = None
+_registry_lock = threading.Lock()
 
 
 def get_registry() -> LLMRegistry:
@@ -106,14 +108,20 @@ def get_registry() -> LLMRegistry:
     Get the singleton LLM registry instance.
 
     Lazily initializes the registry with default clients on first call.
+    Initialization is locked so concurrent first calls from worker
+    threads build exactly one registry; later calls skip the lock.
 
     Returns:
         The global LLMRegistry instance
     """
     global _registry
-    if _registry is None:
-        _registry = _init_default_registry()
-    return _registry
+    registry = _registry
+    if registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = _init_default_registry()
+            registry = _registry
+    return registry
 
 
 def _init_default_registry() -> LLMRegistry:
@@ -122,6 +130,7 @@ def _init_default_registry() -> LLMRegistry:
 
     Environment variables:
     - USE_MOCK_LLM=true: Use mock client (no API calls)
+    - MOCK_LLM_LATENCY_MS: Simulated latency per mock call (default: 0)
     - OPENROUTER_API_KEY: Required for real LLM calls
     - OPENROUTER_MODEL: Model to use (default: FREE model)
 
@@ -141,7 +150,8 @@ def _init_default_registry() -> LLMRegistry:
         from app.llm.mock_client import MockLLMClient
 
         # Create shared mock client (lightweight, can share)
-        mock_client = MockLLMClient(latency_ms=100)
+        latency_ms = float(os.getenv("MOCK_LLM_LATENCY_MS", "0"))
+        mock_client = MockLLMClient(latency_ms=latency_ms)
 
         for role in roles:
             registry.register(role, mock_client)
@@ -175,4 +185,5 @@ def reset_registry() -> None:
     Useful for testing to ensure clean state between tests.
     """
     global _registry
-    _registry = None
+    with _registry_lock:
+        _registry = None
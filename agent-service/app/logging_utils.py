@@ -6,35 +6,109 @@ Every line prefixed with request ID for concurrent request filtering.
 """
 
 import logging
+import os
 import sys
 import time
-import textwrap
+from collections import OrderedDict
 from dataclasses import dataclass, field
+from functools import lru_cache
 from contextvars import ContextVar
 
-# Suppress noisy uvicorn/httpx logs
-logging.getLogger("uvicorn.access").setLevel(logging.WARNING)
-logging.getLogger("httpx").setLevel(logging.WARNING)
+import orjson
 
-# Configure our logger
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(message)s',
-)
 logger = logging.getLogger("code_agent")
 
-# Context variable to track current request ID (thread-safe for async)
-_current_request_id: ContextVar[str | None] = ContextVar('current_request_id', default=None)
+# Banner dividers
+_EQ_LINE = "═" * 66
+_DASH_LINE = "─" * 66
+
+# Context variable to track the current (task_id, short_id) pair
+# (thread-safe for async); the short ID is built once per request
+_current_request: ContextVar[tuple[str, str] | None] = ContextVar(
+    'current_request', default=None
+)
+
+# rid used for records logged outside any request
+_NO_REQUEST_ID = "req-????????"
+
+# Names of loggers _configure_logging has already set up
+_configured_loggers: set[str] = set()
+
+
+class RequestIdFilter(logging.Filter):
+    """Attach record.rid from the current request unless passed via extra."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if not hasattr(record, "rid"):
+            current = _current_request.get()
+            setattr(record, "rid", current[1] if current else _NO_REQUEST_ID)
+        return True
+
+
+class RequestIdFormatter(logging.Formatter):
+    """Prefix every line of a (possibly multi-line) record with [rid]."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        prefix = f"[{getattr(record, 'rid', _NO_REQUEST_ID)}] "
+        return prefix + record.getMessage().replace("\n", "\n" + prefix)
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per record, for log shippers (LOG_FORMAT=json)."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        return orjson.dumps({
+            "ts": record.created,
+            "level": record.levelname,
+            "rid": getattr(record, "rid", _NO_REQUEST_ID),
+            "event": record.funcName,
+            "msg": record.getMessage(),
+        }).decode()
+
+
+def _configure_logging() -> None:
+    """
+    One-shot logging setup.
+
+    Tracked in _configured_loggers, so repeated calls don't stack
+    duplicate handlers or filters.
+    """
+    if logger.name in _configured_loggers:
+        return
+
+    # Suppress noisy uvicorn/httpx logs
+    logging.getLogger("uvicorn.access").setLevel(logging.WARNING)
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(message)s',
+    )
+
+    # Agent logs go to stdout: human-readable banners with per-line request
+    # prefixes by default, NDJSON when LOG_FORMAT=json
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(
+        JsonFormatter() if os.getenv("LOG_FORMAT") == "json" else RequestIdFormatter()
+    )
+    logger.addHandler(handler)
+    logger.addFilter(RequestIdFilter())
+    logger.propagate = False
+    _configured_loggers.add(logger.name)
+
+
+_configure_logging()
 
 
 def set_request_id(task_id: str):
     """Set the current request ID for this async context."""
-    _current_request_id.set(task_id)
+    _current_request.set((task_id, short_id(task_id)))
 
 
 def get_request_id() -> str | None:
     """Get the current request ID."""
-    return _current_request_id.get()
+    current = _current_request.get()
+    return current[0] if current else None
 
 
 def short_id(task_id: str) -> str:
@@ -42,16 +116,39 @@ def short_id(task_id: str) -> str:
     return f"req-{task_id[:8]}"
 
 
+def _write(
+    lines: list[str], task_id: str | None = None, stacklevel: int = 2
+) -> None:
+    """
+    Log a block of lines as one record (one write + flush).
+
+    Concurrent requests interleave at block boundaries, not mid-block.
+    The [req-...] prefix is added per line by RequestIdFormatter; pass
+    task_id when it may differ from the current context's request.
+    stacklevel must point at the public log_* helper so it is recorded
+    as funcName (the JSON "event"); add one per intermediate helper.
+    """
+    extra = None
+    if task_id:
+        current = _current_request.get()
+        if current is None or current[0] != task_id:
+            extra = {"rid": short_id(task_id)}
+    logger.info("\n".join(lines), extra=extra, stacklevel=stacklevel)
+
+
 def log(task_id: str, message: str):
     """Log a message with request ID prefix."""
-    print(f"[{short_id(task_id)}] {message}", flush=True)
+    _write([message], task_id)
 
 
 def _truncate(text: str, max_lines: int = 8, max_chars: int = 400) -> str:
     """Truncate text for logging."""
-    lines = text.split('\n')
-    if len(lines) > max_lines:
-        text = '\n'.join(lines[:max_lines]) + f'\n... ({len(lines) - max_lines} more lines)'
+    extra_lines = text.count('\n') + 1 - max_lines
+    if extra_lines > 0:
+        end = -1
+        for _ in range(max_lines):
+            end = text.find('\n', end + 1)
+        text = text[:end] + f'\n... ({extra_lines} more lines)'
     if len(text) > max_chars:
         text = text[:max_chars] + f'... ({len(text) - max_chars} more chars)'
     return text
@@ -59,30 +156,39 @@ def _truncate(text: str, max_lines: int = 8, max_chars: int = 400) -> str:
 
 def _indent(text: str, prefix: str = "    │ ") -> str:
     """Indent text for nested log output."""
-    return '\n'.join(prefix + line for line in text.split('\n'))
+    return prefix + text.replace('\n', '\n' + prefix)
+
+
+@lru_cache(maxsize=2)
+def _mode_label(mock_mode: bool) -> str:
+    """
+    Banner mode text, built once per mode.
+
+    Resolved on first use rather than at import so OPENROUTER_MODEL
+    from .env (loaded by app.llm) is already in the environment.
+    """
+    if mock_mode:
+        return "MOCK (no API calls)"
+    return f"REAL (OpenRouter: {os.getenv('OPENROUTER_MODEL', 'unknown')})"
 
 
 def log_request_start(task_id: str, description: str, context: str | None, mock_mode: bool):
     """Log when a new request arrives."""
-    import os
     set_request_id(task_id)  # Set for async context
-    rid = short_id(task_id)
-    if mock_mode:
-        mode = "MOCK (no API calls)"
-    else:
-        model = os.getenv("OPENROUTER_MODEL", "unknown")
-        mode = f"REAL (OpenRouter: {model})"
+    mode = _mode_label(mock_mode)
     desc = description[:60] + "..." if len(description) > 60 else description
     ctx = f'"{context[:40]}..."' if context else "None"
 
-    print(f"[{rid}] {'═' * 66}", flush=True)
-    print(f"[{rid}] 🆕 NEW REQUEST", flush=True)
-    print(f"[{rid}] {'─' * 66}", flush=True)
-    print(f"[{rid}] 📝 Task: \"{desc}\"", flush=True)
-    print(f"[{rid}] 📎 Context: {ctx}", flush=True)
-    print(f"[{rid}] 🤖 Mode: {mode}", flush=True)
-    print(f"[{rid}] {'─' * 66}", flush=True)
-    print(f"[{rid}]", flush=True)
+    _write([
+        _EQ_LINE,
+        "🆕 NEW REQUEST",
+        _DASH_LINE,
+        f"📝 Task: \"{desc}\"",
+        f"📎 Context: {ctx}",
+        f"🤖 Mode: {mode}",
+        _DASH_LINE,
+        "",
+    ], task_id)
 
 
 # Human-readable step descriptions: (action, method)
@@ -92,55 +198,73 @@ STEP_DESCRIPTIONS = {
     "evaluate": ("Validating syntax", "using AST parser"),
 }
 
+# Finished "<action> <method>" strings, built once
+_STEP_ACTIONS: dict[str, str] = {
+    step: f"{desc} {method}".strip()
+    for step, (desc, method) in STEP_DESCRIPTIONS.items()
+}
+
 
 def log_agent_step_start(task_id: str, agent_name: str, step_name: str, detail: str = ""):
     """Log when an agent starts a step."""
-    rid = short_id(task_id)
-    desc, method = STEP_DESCRIPTIONS.get(step_name, (step_name, ""))
-    action = f"{desc} {method}".strip()
-    if detail:
-        action = detail
-    print(f"[{rid}] → [{agent_name}] {action}...", flush=True)
+    action = detail or _STEP_ACTIONS.get(step_name, step_name)
+    _write([f"→ [{agent_name}] {action}..."], task_id)
+
+
+# (glyph, label) indexed by "failed"
+_STEP_END = (("✓", "Done"), ("✗", "Failed"))
+
+
+def _log_step_end(task_id: str, duration_ms: float, ok: bool, message: str):
+    """Shared body of log_agent_step_complete / log_agent_step_failed."""
+    glyph, label = _STEP_END[not ok]
+    # Skip this frame so funcName is the public wrapper
+    _write(
+        [f"{glyph} {label} ({duration_ms:.0f}ms) → {message}", ""],
+        task_id,
+        stacklevel=3,
+    )
 
 
 def log_agent_step_complete(task_id: str, duration_ms: float, result: str):
     """Log when an agent step completes."""
-    rid = short_id(task_id)
-    print(f"[{rid}] ✓ Done ({duration_ms:.0f}ms) → {result}", flush=True)
-    print(f"[{rid}]", flush=True)
+    _log_step_end(task_id, duration_ms, True, result)
 
 
 def log_agent_step_failed(task_id: str, duration_ms: float, error: str):
     """Log when an agent step fails."""
-    rid = short_id(task_id)
-    print(f"[{rid}] ✗ Failed ({duration_ms:.0f}ms) → {error}", flush=True)
-    print(f"[{rid}]", flush=True)
+    _log_step_end(task_id, duration_ms, False, error)
 
 
 def log_retry(task_id: str, agent_name: str, attempt: int, max_attempts: int, reason: str):
     """Log a retry attempt."""
-    rid = short_id(task_id)
-    print(f"[{rid}] 🔄 [{agent_name}] Retrying ({attempt}/{max_attempts}): {reason}", flush=True)
-    print(f"[{rid}]", flush=True)
+    _write([
+        f"🔄 [{agent_name}] Retrying ({attempt}/{max_attempts}): {reason}",
+        "",
+    ], task_id)
 
 
 def log_request_complete(task_id: str, total_ms: float, status: str, code_length: int):
     """Log when a request completes successfully."""
-    rid = short_id(task_id)
-    print(f"[{rid}] {'═' * 66}", flush=True)
-    print(f"[{rid}] ✅ COMPLETE | {total_ms:.0f}ms total | {code_length} chars generated", flush=True)
-    print(f"[{rid}] {'═' * 66}", flush=True)
-    print(flush=True)
+    _write([
+        _EQ_LINE,
+        f"✅ COMPLETE | {total_ms:.0f}ms total | {code_length} chars generated",
+        _EQ_LINE,
+        "",
+    ], task_id)
+    release_workflow_metrics(task_id)
 
 
 def log_request_failed(task_id: str, total_ms: float, error: str):
     """Log when a request fails."""
-    rid = short_id(task_id)
     error_short = error[:50] + "..." if len(error) > 50 else error
-    print(f"[{rid}] {'═' * 66}", flush=True)
-    print(f"[{rid}] ❌ FAILED | {total_ms:.0f}ms | {error_short}", flush=True)
-    print(f"[{rid}] {'═' * 66}", flush=True)
-    print(flush=True)
+    _write([
+        _EQ_LINE,
+        f"❌ FAILED | {total_ms:.0f}ms | {error_short}",
+        _EQ_LINE,
+        "",
+    ], task_id)
+    release_workflow_metrics(task_id)
 
 
 # ============================================================================
@@ -150,98 +274,97 @@ def log_request_failed(task_id: str, total_ms: float, error: str):
 def log_agent_start(agent_name: str, action: str):
     """Log when an agent starts working."""
     task_id = get_request_id()
-    if not task_id:
+    if not task_id or not logger.isEnabledFor(logging.INFO):
         return
-    rid = short_id(task_id)
-    print(f"[{rid}]", flush=True)
-    print(f"[{rid}] ┌─ 🤖 {agent_name}", flush=True)
-    print(f"[{rid}] │  Action: {action}", flush=True)
+    _write([
+        "",
+        f"┌─ 🤖 {agent_name}",
+        f"│  Action: {action}",
+    ])
 
 
 def log_agent_complete(agent_name: str, result: str, duration_ms: float):
     """Log when an agent completes."""
     task_id = get_request_id()
-    if not task_id:
+    if not task_id or not logger.isEnabledFor(logging.INFO):
         return
-    rid = short_id(task_id)
-    print(f"[{rid}] │  Result: {result}", flush=True)
-    print(f"[{rid}] └─ ✅ Done ({duration_ms:.0f}ms)", flush=True)
+    _write([
+        f"│  Result: {result}",
+        f"└─ ✅ Done ({duration_ms:.0f}ms)",
+    ])
 
 
 def log_llm_request(agent_name: str, purpose: str, prompt_preview: str, system_preview: str | None = None):
-    """Log an LLM request with prompt preview."""
+    """
+    Log an LLM request with prompt preview.
+
+    Pass the raw prompts; they are only truncated here, and not at all
+    when INFO logging is disabled.
+    """
     task_id = get_request_id()
-    if not task_id:
+    if not task_id or not logger.isEnabledFor(logging.INFO):
         return
-    rid = short_id(task_id)
 
-    print(f"[{rid}] │", flush=True)
-    print(f"[{rid}] │  📤 LLM Request: {purpose}", flush=True)
+    lines = ["│", f"│  📤 LLM Request: {purpose}"]
 
     if system_preview:
         sys_short = _truncate(system_preview, max_lines=3, max_chars=150)
-        for line in sys_short.split('\n'):
-            print(f"[{rid}] │     [system] {line}", flush=True)
+        lines.append(_indent(sys_short, "│     [system] "))
 
     prompt_short = _truncate(prompt_preview, max_lines=5, max_chars=300)
-    for line in prompt_short.split('\n'):
-        print(f"[{rid}] │     [prompt] {line}", flush=True)
+    lines.append(_indent(prompt_short, "│     [prompt] "))
+
+    _write(lines)
 
 
 def log_llm_response(agent_name: str, response_preview: str, tokens: int, duration_ms: float):
     """Log an LLM response with preview."""
     task_id = get_request_id()
-    if not task_id:
+    if not task_id or not logger.isEnabledFor(logging.INFO):
         return
-    rid = short_id(task_id)
 
-    print(f"[{rid}] │  📥 LLM Response ({tokens} tokens, {duration_ms:.0f}ms):", flush=True)
+    lines = [f"│  📥 LLM Response ({tokens} tokens, {duration_ms:.0f}ms):"]
     response_short = _truncate(response_preview, max_lines=6, max_chars=400)
-    for line in response_short.split('\n'):
-        print(f"[{rid}] │     {line}", flush=True)
+    lines.append(_indent(response_short, "│     "))
+
+    _write(lines)
 
 
 def log_validation_step(step_name: str, passed: bool, message: str):
     """Log a validation step result."""
     task_id = get_request_id()
-    if not task_id:
+    if not task_id or not logger.isEnabledFor(logging.INFO):
         return
-    rid = short_id(task_id)
     icon = "✅" if passed else "❌"
-    print(f"[{rid}] │  {icon} {step_name}: {message}", flush=True)
+    _write([f"│  {icon} {step_name}: {message}"])
 
 
 def log_reflection(attempt: int, max_attempts: int, issues: list[str]):
     """Log when reflection/retry happens."""
     task_id = get_request_id()
-    if not task_id:
+    if not task_id or not logger.isEnabledFor(logging.INFO):
         return
-    rid = short_id(task_id)
-    print(f"[{rid}]", flush=True)
-    print(f"[{rid}] ┌─ 🔄 REFLECTION (attempt {attempt}/{max_attempts})", flush=True)
+    lines = ["", f"┌─ 🔄 REFLECTION (attempt {attempt}/{max_attempts})"]
     for issue in issues[:3]:
-        print(f"[{rid}] │  • {issue[:60]}", flush=True)
+        lines.append(f"│  • {issue[:60]}")
     if len(issues) > 3:
-        print(f"[{rid}] │  ... and {len(issues) - 3} more issues", flush=True)
-    print(f"[{rid}] └─", flush=True)
+        lines.append(f"│  ... and {len(issues) - 3} more issues")
+    lines.append("└─")
+    _write(lines)
 
 
 # Legacy no-ops for backward compatibility
-def log_node_start(task_id: str, node_name: str, message: str):
-    pass
-
-def log_node_complete(task_id: str, node_name: str, message: str, status: str = "success"):
-    pass
-
-def log_workflow_complete(task_id: str):
+def _noop(*args, **kwargs) -> None:
     pass
 
-def log_error(task_id: str, node_name: str, error: str):
-    pass
+log_node_start = _noop
+log_node_complete = _noop
+log_workflow_complete = _noop
+log_error = _noop
 
 
 # Metrics classes for backward compatibility
-@dataclass
+@dataclass(slots=True)
 class NodeMetrics:
     node_name: str
     start_time: float = field(default_factory=time.time)
@@ -255,7 +378,7 @@ class NodeMetrics:
         self.status = status
 
 
-@dataclass
+@dataclass(slots=True)
 class WorkflowMetrics:
     task_id: str
     nodes: list[NodeMetrics] = field(default_factory=list)
@@ -276,9 +399,20 @@ class WorkflowMetrics:
         return 0
 
 
-_workflow_metrics: dict[str, WorkflowMetrics] = {}
+# Bounded LRU so metrics for abandoned requests can't accumulate forever
+_MAX_WORKFLOW_METRICS = 1024
+_workflow_metrics: OrderedDict[str, WorkflowMetrics] = OrderedDict()
 
 def get_workflow_metrics(task_id: str) -> WorkflowMetrics:
-    if task_id not in _workflow_metrics:
-        _workflow_metrics[task_id] = WorkflowMetrics(task_id=task_id)
-    return _workflow_metrics[task_id]
+    metrics = _workflow_metrics.get(task_id)
+    if metrics is None:
+        if len(_workflow_metrics) >= _MAX_WORKFLOW_METRICS:
+            _workflow_metrics.popitem(last=False)
+        metrics = _workflow_metrics[task_id] = WorkflowMetrics(task_id=task_id)
+    else:
+        _workflow_metrics.move_to_end(task_id)
+    return metrics
+
+def release_workflow_metrics(task_id: str) -> None:
+    """Drop a finished request's metrics."""
+    _workflow_metrics.pop(task_id, None)
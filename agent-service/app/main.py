@@ -4,14 +4,28 @@ FastAPI Application
 Main entry point for the agent service.
 """
 
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
+from app.api.routes import code_executor
 from app.api.routes import router as tasks_router
 from app.health.health import router as health_router
+from app.llm.http_client import close_http_client
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Release shared resources on shutdown."""
+    yield
+    await close_http_client()
+    code_executor.close()
+
 
 app = FastAPI(
     title="Code Agent API",
     description="LangGraph-based AI agent for code generation and manipulation",
     version="0.1.0",
+    lifespan=lifespan,
 )
 
 # Register routers
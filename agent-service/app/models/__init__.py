@@ -15,6 +15,7 @@ from .planning import (
 from .execution import (
     StepTask,
     CodeOutput,
+    Severity,
     ReviewIssue,
     ReviewResult,
     CompletedStep,
@@ -36,6 +37,7 @@ __all__ = [
     # Execution
     "StepTask",
     "CodeOutput",
+    "Severity",
     "ReviewIssue",
     "ReviewResult",
     "CompletedStep",
@@ -9,11 +9,20 @@ This module defines data structures passed between agents:
 - ProjectResult: Final output to user
 """
 
+import sys
 from dataclasses import dataclass, field
+from enum import StrEnum
+from functools import cached_property
 from typing import Any
 
 
-@dataclass
+def _count_lines(text: str) -> int:
+    """Line count of stripped text, without splitting it into a list."""
+    text = text.strip()
+    return text.count("\n") + 1 if text else 0
+
+
+@dataclass(slots=True)
 class StepTask:
     """Task sent from Manager to Builder.
 
@@ -32,14 +41,19 @@ class StepTask:
     completed_code: dict[str, str] = field(default_factory=dict)  # step_id -> code
     issues: list["ReviewIssue"] = field(default_factory=list)  # For retry attempts
     previous_code: str = ""  # For reflection: the code that was reviewed
+    _is_retry: bool = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Decide once whether this is a retry; tasks aren't modified after creation."""
+        self._is_retry = bool(self.issues) and bool(self.previous_code)
 
     @property
     def is_retry(self) -> bool:
         """Check if this is a retry attempt (has issues to fix)."""
-        return len(self.issues) > 0 and bool(self.previous_code)
+        return self._is_retry
 
 
-@dataclass
+@dataclass(frozen=True)
 class CodeOutput:
     """Output from Builder after generating code.
 
@@ -53,18 +67,26 @@ class CodeOutput:
     code: str
     tests: str
 
-    @property
+    @cached_property
     def code_lines(self) -> int:
         """Count of lines in generated code."""
-        return len(self.code.strip().split("\n")) if self.code.strip() else 0
+        return _count_lines(self.code)
 
-    @property
+    @cached_property
     def test_lines(self) -> int:
         """Count of lines in generated tests."""
-        return len(self.tests.strip().split("\n")) if self.tests.strip() else 0
+        return _count_lines(self.tests)
+
+
+class Severity(StrEnum):
+    """Severity of a ReviewIssue. Compares equal to its plain string."""
+
+    ERROR = "error"
+    WARNING = "warning"
+    SUGGESTION = "suggestion"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ReviewIssue:
     """Single issue found by Reviewer.
 
@@ -74,27 +96,36 @@ class ReviewIssue:
     - suggestion: Optional improvement
     """
 
-    severity: str  # "error", "warning", "suggestion"
+    # Plain "error"/"warning"/"suggestion" strings are accepted and
+    # normalized to Severity in __post_init__
+    severity: Severity | str
     category: str  # "correctness", "style", "performance", "security", etc.
     message: str
     suggestion: str | None = None
 
     def __post_init__(self):
-        """Validate issue data."""
-        if self.severity not in ("error", "warning", "suggestion"):
-            raise ValueError(f"Invalid severity: {self.severity}")
+        """Validate issue data and normalize severity/category."""
+        try:
+            severity = Severity(self.severity)
+        except ValueError:
+            raise ValueError(f"Invalid severity: {self.severity}") from None
+        # Frozen dataclass: normalize in place. Categories are a small
+        # vocabulary repeated across many issues, so share one copy each.
+        object.__setattr__(self, "severity", severity)
+        object.__setattr__(self, "category", sys.intern(self.category))
 
     def to_dict(self) -> dict:
         """Convert to dictionary for serialization."""
         return {
-            "severity": self.severity,
+            # StrEnum's str() is its value
+            "severity": str(self.severity),
             "category": self.category,
             "message": self.message,
             "suggestion": self.suggestion,
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class ReviewResult:
     """Output from Reviewer after reviewing code.
 
@@ -109,22 +140,26 @@ class ReviewResult:
     test_output: str
     review_passed: bool
     issues: list[ReviewIssue] = field(default_factory=list)
+    # Counted once at construction; issues aren't modified afterwards
+    error_count: int = field(init=False, repr=False, compare=False)
+    warning_count: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Count error and warning issues in one pass."""
+        errors = warnings = 0
+        for issue in self.issues:
+            if issue.severity is Severity.ERROR:
+                errors += 1
+            elif issue.severity is Severity.WARNING:
+                warnings += 1
+        self.error_count = errors
+        self.warning_count = warnings
 
     @property
     def overall_passed(self) -> bool:
         """Check if both tests and review passed."""
         return self.tests_passed and self.review_passed
 
-    @property
-    def error_count(self) -> int:
-        """Count of error-severity issues."""
-        return sum(1 for i in self.issues if i.severity == "error")
-
-    @property
-    def warning_count(self) -> int:
-        """Count of warning-severity issues."""
-        return sum(1 for i in self.issues if i.severity == "warning")
-
     def to_dict(self) -> dict:
         """Convert to dictionary for SSE serialization."""
         return {
@@ -139,7 +174,7 @@ class ReviewResult:
         }
 
 
-@dataclass
+@dataclass(frozen=True)
 class CompletedStep:
     """A step that has completed the Builder → Reviewer loop.
 
@@ -152,13 +187,13 @@ class CompletedStep:
     attempts: int  # How many Builder→Reviewer cycles it took
     passed: bool = True  # Whether review passed (False if max retries exhausted)
 
-    @property
+    @cached_property
     def code_lines(self) -> int:
         """Count of lines in final code."""
-        return len(self.code.strip().split("\n")) if self.code.strip() else 0
+        return _count_lines(self.code)
 
 
-@dataclass
+@dataclass(frozen=True)
 class DocumentedCode:
     """Output from DocGen after adding documentation.
 
@@ -170,13 +205,13 @@ class DocumentedCode:
     code: str
     readme: str
 
-    @property
+    @cached_property
     def readme_lines(self) -> int:
         """Count of lines in README."""
-        return len(self.readme.strip().split("\n")) if self.readme.strip() else 0
+        return _count_lines(self.readme)
 
 
-@dataclass
+@dataclass(frozen=True)
 class ProjectResult:
     """Final output returned to user.
 
@@ -192,15 +227,15 @@ class ProjectResult:
     success: bool
     error_message: str | None = None
 
-    @property
+    @cached_property
     def code_lines(self) -> int:
         """Total lines of code."""
-        return len(self.code.strip().split("\n")) if self.code.strip() else 0
+        return _count_lines(self.code)
 
-    @property
+    @cached_property
     def test_lines(self) -> int:
         """Total lines of tests."""
-        return len(self.tests.strip().split("\n")) if self.tests.strip() else 0
+        return _count_lines(self.tests)
 
     def to_dict(self) -> dict:
         """Convert to dictionary for SSE serialization."""
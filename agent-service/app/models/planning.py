@@ -10,8 +10,11 @@ from dataclasses import dataclass, field
 
 from .agents import AgentType
 
+# Characters that would break a quoted Mermaid node label
+_MERMAID_SANITIZE = str.maketrans({'"': "'", "[": "(", "]": ")"})
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class PlanStep:
     """Single step in the execution plan.
 
@@ -39,7 +42,7 @@ class PlanStep:
             raise ValueError(f"Invalid complexity: {self.complexity}")
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ExecutionStage:
     """Group of steps that execute together in one stage.
 
@@ -53,11 +56,17 @@ class ExecutionStage:
     stage_number: int
     steps: list[PlanStep]
     parallel: bool  # True if steps within this stage can run simultaneously
+    _step_ids: tuple[str, ...] = field(init=False, repr=False, compare=False)
+    _step_id_set: frozenset[str] = field(init=False, repr=False, compare=False)
 
     @property
     def step_ids(self) -> list[str]:
         """Get list of step IDs in this stage."""
-        return [s.id for s in self.steps]
+        return list(self._step_ids)
+
+    def contains_step(self, step_id: str) -> bool:
+        """Check whether a step belongs to this stage."""
+        return step_id in self._step_id_set
 
     @property
     def step_count(self) -> int:
@@ -71,8 +80,12 @@ class ExecutionStage:
         if not self.steps:
             raise ValueError("Stage must have at least one step")
 
+        step_ids = tuple(s.id for s in self.steps)
+        object.__setattr__(self, "_step_ids", step_ids)
+        object.__setattr__(self, "_step_id_set", frozenset(step_ids))
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class ExecutionPlan:
     """Complete execution plan created by Manager.
 
@@ -88,6 +101,23 @@ class ExecutionPlan:
     reasoning: str
     stages: list[ExecutionStage]
     team_summary: dict[str, int]  # From AgentTeam.get_team_summary()
+    _step_index: dict[str, PlanStep] = field(init=False, repr=False, compare=False)
+    _stage_index: dict[str, ExecutionStage] = field(init=False, repr=False, compare=False)
+    _mermaid: str | None = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Index steps and their stages by ID for O(1) lookups."""
+        step_index: dict[str, PlanStep] = {}
+        stage_index: dict[str, ExecutionStage] = {}
+        for stage in self.stages:
+            for step in stage.steps:
+                # First occurrence wins, matching a front-to-back scan
+                if step.id not in step_index:
+                    step_index[step.id] = step
+                    stage_index[step.id] = stage
+        # Frozen dataclass: set the derived fields directly
+        object.__setattr__(self, "_step_index", step_index)
+        object.__setattr__(self, "_stage_index", stage_index)
 
     @property
     def total_steps(self) -> int:
@@ -110,18 +140,11 @@ class ExecutionPlan:
 
     def get_step(self, step_id: str) -> PlanStep | None:
         """Find a step by ID."""
-        for stage in self.stages:
-            for step in stage.steps:
-                if step.id == step_id:
-                    return step
-        return None
+        return self._step_index.get(step_id)
 
     def get_stage_for_step(self, step_id: str) -> ExecutionStage | None:
         """Find which stage contains a step."""
-        for stage in self.stages:
-            if step_id in stage.step_ids:
-                return stage
-        return None
+        return self._stage_index.get(step_id)
 
     def to_mermaid(self) -> str:
         """Generate Mermaid diagram showing execution flow.
@@ -130,55 +153,71 @@ class ExecutionPlan:
         - Each step as a node
         - Dependencies as arrows
         - Parallel stages highlighted
-        """
-        lines = ["graph TD"]
 
-        # Add all nodes with descriptive labels
+        The plan is immutable, so the diagram is built once and reused.
+        """
+        mermaid = self._mermaid
+        if mermaid is None:
+            mermaid = self._build_mermaid()
+            object.__setattr__(self, "_mermaid", mermaid)
+        return mermaid
+
+    def _build_mermaid(self) -> str:
+        """Render the Mermaid diagram (see to_mermaid)."""
+        nodes = ["graph TD"]
+        edges: list[str] = []
+        groups: list[str] = []
+
+        # One pass over the stages, collecting each section separately so
+        # the output keeps the nodes, then edges, then groupings order
         for stage in self.stages:
             for step in stage.steps:
                 # Sanitize task for mermaid (remove special chars)
-                safe_task = step.task.replace('"', "'").replace("[", "(").replace("]", ")")
-                lines.append(f'    {step.id}["{safe_task}"]')
-
-        # Add edges based on dependencies
-        for stage in self.stages:
-            for step in stage.steps:
+                label = step.task.translate(_MERMAID_SANITIZE)
+                nodes.append(f'    {step.id}["{label}"]')
                 for dep in step.depends_on:
-                    lines.append(f"    {dep} --> {step.id}")
+                    edges.append(f"    {dep} --> {step.id}")
 
-        # Add visual grouping for parallel stages
-        for stage in self.stages:
+            # Add visual grouping for parallel stages
             if stage.parallel and len(stage.steps) > 1:
-                step_list = ", ".join(stage.step_ids)
-                lines.append(f"    %% Stage {stage.stage_number} (parallel): {step_list}")
+                step_list = ", ".join(stage._step_ids)
+                groups.append(
+                    f"    %% Stage {stage.stage_number} (parallel): {step_list}"
+                )
 
-        return "\n".join(lines)
+        return "\n".join(nodes + edges + groups)
 
     def to_dict(self) -> dict:
         """Convert plan to dictionary for SSE serialization."""
+        # One walk over the stages for the counts and the stage list
+        total_steps = parallelizable_steps = 0
+        stages = []
+        for stage in self.stages:
+            steps = stage.steps
+            total_steps += len(steps)
+            if stage.parallel and len(steps) > 1:
+                parallelizable_steps += len(steps)
+            stages.append({
+                "stage_number": stage.stage_number,
+                "parallel": stage.parallel,
+                "steps": [
+                    {
+                        "id": step.id,
+                        "task": step.task,
+                        "depends_on": step.depends_on,
+                        "agent_type": step.agent_type.value,
+                        "complexity": step.complexity,
+                    }
+                    for step in steps
+                ],
+            })
         return {
             "task": self.task,
             "reasoning": self.reasoning,
-            "total_steps": self.total_steps,
-            "total_stages": self.total_stages,
-            "parallelizable_steps": self.parallelizable_steps,
+            "total_steps": total_steps,
+            "total_stages": len(self.stages),
+            "parallelizable_steps": parallelizable_steps,
             "team_summary": self.team_summary,
-            "stages": [
-                {
-                    "stage_number": stage.stage_number,
-                    "parallel": stage.parallel,
-                    "steps": [
-                        {
-                            "id": step.id,
-                            "task": step.task,
-                            "depends_on": step.depends_on,
-                            "agent_type": step.agent_type.value,
-                            "complexity": step.complexity,
-                        }
-                        for step in stage.steps
-                    ],
-                }
-                for stage in self.stages
-            ],
+            "stages": stages,
             "mermaid": self.to_mermaid(),
         }
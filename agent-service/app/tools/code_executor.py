@@ -4,11 +4,24 @@ Code Executor Tool
 Executes Python code in a subprocess and captures output.
 """
 
+import asyncio
+import os
 import subprocess
 import re
+import threading
 from app.core.base_tool import BaseTool, ToolResult
 
 
+# Bootstrap run by each pre-started interpreter: block on stdin until code
+# arrives, then run it as if it were passed to `python -c`.
+_WORKER_BOOTSTRAP = (
+    "import sys; "
+    "exec(compile(sys.stdin.read(), '<string>', 'exec'), {'__name__': '__main__'})"
+)
+
+DEFAULT_POOL_SIZE = min(4, os.cpu_count() or 1)
+
+
 # Known GUI/game modules that can't run in headless mode
 GUI_MODULES = {
     "pygame": "pip install pygame",
@@ -24,17 +37,25 @@ GUI_MODULES = {
 }
 
 
+# Matches "ModuleNotFoundError: No module named 'xyz'"
+_MODULE_ERROR_PATTERN = re.compile(
+    r"ModuleNotFoundError: No module named ['\"](\w+)['\"]"
+)
+
+
 def _format_module_error(stderr: str) -> str | None:
     """Check if error is a missing module and return helpful message."""
-    # Match "ModuleNotFoundError: No module named 'xyz'"
-    match = re.search(r"ModuleNotFoundError: No module named ['\"](\w+)['\"]", stderr)
+    # Cheap substring check skips the regex for ordinary errors
+    if "ModuleNotFoundError" not in stderr:
+        return None
+    match = _MODULE_ERROR_PATTERN.search(stderr)
     if not match:
         return None
 
     module = match.group(1)
 
-    if module in GUI_MODULES:
-        install_hint = GUI_MODULES[module]
+    install_hint = GUI_MODULES.get(module)
+    if install_hint is not None:
         return (
             f"⚠️ This code requires '{module}' which is a GUI/game library.\n\n"
             f"To run this code locally:\n"
@@ -58,11 +79,71 @@ class CodeExecutor(BaseTool):
     Uses subprocess for isolation - the executed code runs in a
     completely separate Python process and cannot affect our application.
 
+    Interpreter startup is taken off the request path by keeping a small
+    pool of pre-started workers that are already waiting on stdin. Each
+    worker runs exactly one snippet and exits, so every execution still
+    gets a fresh process; a replacement is spawned as soon as one is
+    taken. Spawning happens on a worker thread, never on the event loop.
+    Call close() on shutdown; idle workers also exit on their own when
+    this process goes away (their stdin hits EOF).
+
     For production, consider Docker-based execution for full sandboxing.
     """
 
-    def __init__(self, timeout_seconds: int = 5):
+    def __init__(self, timeout_seconds: int = 5, pool_size: int = DEFAULT_POOL_SIZE):
         self.timeout_seconds = timeout_seconds
+        self.pool_size = pool_size
+        self._idle: list[subprocess.Popen[str]] = []
+        # Guards _idle; execute() touches it from to_thread workers
+        self._lock = threading.Lock()
+
+    def _spawn_worker(self) -> subprocess.Popen[str]:
+        """Start an interpreter that waits for code on stdin."""
+        return subprocess.Popen(
+            ["python", "-c", _WORKER_BOOTSTRAP],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+        )
+
+    def _acquire_worker(self) -> subprocess.Popen[str]:
+        """Take a warm worker from the pool (or start one) and refill the pool."""
+        with self._lock:
+            worker = None
+            while self._idle:
+                candidate = self._idle.pop()
+                if candidate.poll() is None:
+                    worker = candidate
+                    break
+            if worker is None:
+                worker = self._spawn_worker()
+
+            while len(self._idle) < self.pool_size:
+                self._idle.append(self._spawn_worker())
+
+        return worker
+
+    def _run(self, code: str) -> subprocess.CompletedProcess[str]:
+        """Run code in a warm worker. Blocking; call via asyncio.to_thread."""
+        worker = self._acquire_worker()
+        try:
+            stdout, stderr = worker.communicate(code, timeout=self.timeout_seconds)
+        except subprocess.TimeoutExpired:
+            worker.kill()
+            worker.communicate()
+            raise
+        return subprocess.CompletedProcess(
+            worker.args, worker.returncode, stdout, stderr
+        )
+
+    def close(self) -> None:
+        """Terminate all idle workers."""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for worker in idle:
+            worker.kill()
+            worker.communicate()
 
     @property
     def name(self) -> str:
@@ -90,12 +171,7 @@ class CodeExecutor(BaseTool):
             )
 
         try:
-            result = subprocess.run(
-                ["python", "-c", code],
-                capture_output=True,
-                text=True,
-                timeout=self.timeout_seconds
-            )
+            result = await asyncio.to_thread(self._run, code)
 
             if result.returncode == 0:
                 return ToolResult(
@@ -5,15 +5,19 @@ Validates that generated code is syntactically correct Python.
 Fast check that doesn't execute any code.
 """
 
-import ast
 from app.core.base_tool import BaseTool, ToolResult
 
+# Larger inputs are rejected outright rather than compiled
+MAX_CODE_CHARS = 1_000_000
+
 
 class SyntaxChecker(BaseTool):
     """
     Checks if Python code is syntactically valid.
     
-    Uses Python's ast module to parse code without executing it.
+    Compiles the code to bytecode (discarded) without executing it.
+    Unlike ast.parse this also catches compile-time errors such as
+    'return' outside a function, and skips building Python AST objects.
     This is safe and fast - good as a first validation step.
     """
     
@@ -42,8 +46,18 @@ class SyntaxChecker(BaseTool):
                 error_message="Empty code provided"
             )
         
+        if len(code) > MAX_CODE_CHARS:
+            return ToolResult(
+                success=False,
+                output=None,
+                error_message=(
+                    f"Code too large to check "
+                    f"({len(code)} chars, max {MAX_CODE_CHARS})"
+                ),
+            )
+
         try:
-            ast.parse(code)
+            compile(code, "<syntax_check>", "exec", dont_inherit=True)
             return ToolResult(
                 success=True,
                 output="Syntax is valid",
@@ -10,24 +10,32 @@ Requires server running:
     USE_MOCK_LLM=true uvicorn app.main:app --reload
 """
 
-import json
 import sys
 
+import orjson
 import requests
 
+_DATA_PREFIX = b"data:"
+
 
 def parse_sse_events(response) -> list[dict]:
     """Parse SSE events from streaming response."""
     events = []
-    for line in response.iter_lines():
-        if line:
-            line = line.decode("utf-8")
-            if line.startswith("data:"):
-                try:
-                    event = json.loads(line[5:].strip())
-                    events.append(event)
-                except json.JSONDecodeError as e:
-                    print(f"  Warning: Failed to parse SSE: {e}")
+    # Work on the raw bytes: orjson.loads decodes UTF-8 itself and skips
+    # surrounding whitespace, so lines are never decoded or stripped here.
+    # (decode_unicode=True would guess ISO-8859-1 for text/event-stream.)
+    # Comments (":keepalive"), "event:" lines and blank separators fall
+    # through the prefix check; empty data lines never reach the parser.
+    for line in response.iter_lines(chunk_size=8192):
+        if not line.startswith(_DATA_PREFIX):
+            continue
+        payload = line[len(_DATA_PREFIX):]
+        if not payload or payload.isspace():
+            continue
+        try:
+            events.append(orjson.loads(payload))
+        except orjson.JSONDecodeError as e:
+            print(f"  Warning: Failed to parse SSE: {e}")
     return events
 
 
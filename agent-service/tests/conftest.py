@@ -0,0 +1,81 @@
+"""Shared pytest fixtures."""
+
+import copy
+from typing import Callable
+
+import pytest
+
+from app.llm import LLMRegistry, get_registry, reset_registry
+from app.llm.mock_client import MockLLMClient
+
+# MockLLMClient holds only scalars (latency_ms, yield_only, call_count),
+# so a shallow copy is an independent client
+_MOCK_CLIENT_PROTOTYPE = MockLLMClient()
+
+_registry_cache: dict[frozenset, LLMRegistry] = {}
+
+
+def _build_registry(env: dict[str, str]) -> LLMRegistry:
+    """
+    Build a default registry under the given environment, once per env.
+
+    USE_MOCK_LLM is unset unless env provides it, and mock latency is
+    pinned to zero. The global singleton is reset before and after, so
+    the returned registry is detached and the environment is restored
+    on exit.
+    """
+    key = frozenset(env.items())
+    registry = _registry_cache.get(key)
+    if registry is not None:
+        return registry
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.delenv("USE_MOCK_LLM", raising=False)
+        # Ignore any MOCK_LLM_LATENCY_MS exported in the developer's shell
+        mp.setenv("MOCK_LLM_LATENCY_MS", "0")
+        for name, value in env.items():
+            mp.setenv(name, value)
+        reset_registry()
+        try:
+            registry = get_registry()
+        finally:
+            reset_registry()
+
+    _registry_cache[key] = registry
+    return registry
+
+
+@pytest.fixture(scope="session")
+def build_registry() -> Callable[[dict[str, str]], LLMRegistry]:
+    """
+    Callable building (or reusing) the registry for an env dict. Do not
+    mutate the result.
+
+    Call it from the test body so a failure to build the registry is
+    reported as a test failure rather than a fixture error.
+    """
+    return _build_registry
+
+
+@pytest.fixture(scope="session")
+def mock_registry() -> LLMRegistry:
+    """Registry built once with USE_MOCK_LLM=true. Do not mutate."""
+    return _build_registry({"USE_MOCK_LLM": "true"})
+
+
+@pytest.fixture
+def fresh_registry(mock_registry) -> LLMRegistry:
+    """Private deep copy of mock_registry; safe to mutate."""
+    return copy.deepcopy(mock_registry)
+
+
+@pytest.fixture
+def mock_client() -> MockLLMClient:
+    """A fresh MockLLMClient with no calls recorded."""
+    return copy.copy(_MOCK_CLIENT_PROTOTYPE)
+
+
+@pytest.fixture
+def mock_client_factory() -> Callable[[], MockLLMClient]:
+    """Callable returning a new, distinct MockLLMClient on each call."""
+    return lambda: copy.copy(_MOCK_CLIENT_PROTOTYPE)
@@ -0,0 +1,124 @@
+"""Tests for the CodeExecutor tool."""
+
+import asyncio
+import threading
+
+import pytest
+
+from app.tools.code_executor import CodeExecutor
+
+
+@pytest.fixture
+def executor():
+    """CodeExecutor with a small warm pool, cleaned up after each test."""
+    executor = CodeExecutor(timeout_seconds=2, pool_size=2)
+    yield executor
+    executor.close()
+
+
+class TestCodeExecutor:
+    """Tests for running code in warm worker processes."""
+
+    @pytest.mark.asyncio
+    async def test_captures_stdout(self, executor):
+        """Printed output should be returned on success."""
+        result = await executor.execute("print('hello')")
+
+        assert result.success
+        assert result.output == "hello\n"
+
+    @pytest.mark.asyncio
+    async def test_runs_as_main(self, executor):
+        """Code should see __name__ == '__main__' like `python -c`."""
+        result = await executor.execute("if __name__ == '__main__':\n    print('main')")
+
+        assert result.output == "main\n"
+
+    @pytest.mark.asyncio
+    async def test_executions_do_not_share_state(self, executor):
+        """Each execution gets a fresh process."""
+        await executor.execute("import builtins; builtins.leaked = 1")
+        result = await executor.execute(
+            "import builtins; print(hasattr(builtins, 'leaked'))"
+        )
+
+        assert result.output == "False\n"
+
+    @pytest.mark.asyncio
+    async def test_pool_is_refilled(self, executor):
+        """Taking a worker should leave the pool at its configured size."""
+        await executor.execute("x = 1")
+
+        assert len(executor._idle) == 2
+
+    @pytest.mark.asyncio
+    async def test_runtime_error_returns_stderr(self, executor):
+        """Exceptions in user code should surface as error_message."""
+        result = await executor.execute("raise ValueError('boom')")
+
+        assert not result.success
+        assert "ValueError: boom" in result.error_message
+
+    @pytest.mark.asyncio
+    async def test_missing_module_is_friendly(self, executor):
+        """Missing imports should produce an install hint."""
+        result = await executor.execute("import pygame")
+
+        assert not result.success
+        assert "pip install pygame" in result.error_message
+
+    @pytest.mark.asyncio
+    async def test_timeout(self):
+        """Long-running code should be killed after the timeout."""
+        executor = CodeExecutor(timeout_seconds=1, pool_size=1)
+        try:
+            result = await executor.execute("while True: pass")
+        finally:
+            executor.close()
+
+        assert not result.success
+        assert "timed out" in result.error_message
+
+    @pytest.mark.asyncio
+    async def test_concurrent_executions(self, executor):
+        """Concurrent calls should each get their own output."""
+        results = await asyncio.gather(
+            *[executor.execute(f"print({i})") for i in range(5)]
+        )
+
+        assert [r.output for r in results] == [f"{i}\n" for i in range(5)]
+
+    @pytest.mark.asyncio
+    async def test_empty_code(self, executor):
+        """Empty code should fail without spawning anything."""
+        result = await executor.execute("   ")
+
+        assert not result.success
+        assert result.error_message == "Empty code provided"
+
+    @pytest.mark.asyncio
+    async def test_workers_spawn_off_the_event_loop(self, executor):
+        """Pool spawn and refill should run on a worker thread."""
+        spawn_threads = []
+        spawn = executor._spawn_worker
+
+        def recording_spawn():
+            spawn_threads.append(threading.current_thread())
+            return spawn()
+
+        executor._spawn_worker = recording_spawn
+        await executor.execute("x = 1")
+
+        assert spawn_threads
+        assert threading.main_thread() not in spawn_threads
+
+    @pytest.mark.asyncio
+    async def test_close_terminates_idle_workers(self, executor):
+        """close() should kill and drop every idle worker."""
+        await executor.execute("x = 1")
+        idle = list(executor._idle)
+
+        executor.close()
+
+        assert executor._idle == []
+        assert all(worker.poll() is not None for worker in idle)
@@ -0,0 +1,100 @@
+"""Tests for LLM response cache."""
+
+import pytest
+
+from app.core.base_llm import LLMResponse
+from app.core.task_state import TaskState, TaskType
+from app.executors.code_executor import CodeExecutor
+from app.llm.cache import InMemoryBackend, LLMCache
+from app.llm.mock_client import MockLLMClient
+
+
+def _key(**overrides) -> str:
+    fields = {
+        "model": "mock",
+        "system_prompt": "system",
+        "prompt": "prompt",
+        "context_hash": None,
+        "temperature": 0,
+    }
+    fields.update(overrides)
+    return LLMCache.make_key(**fields)
+
+
+class TestLLMCache:
+    """Tests for LLMCache class."""
+
+    def test_key_is_stable(self):
+        """Same request fields should produce the same key."""
+        assert _key() == _key()
+
+    def test_key_changes_with_context(self):
+        """Different context should produce a different key."""
+        assert _key() != _key(context_hash="abc123")
+
+    def test_only_zero_temperature_is_cacheable(self):
+        """Sampling calls must not be cached."""
+        assert LLMCache.is_cacheable(0)
+        assert not LLMCache.is_cacheable(0.7)
+
+    @pytest.mark.asyncio
+    async def test_round_trip_and_stats(self):
+        """Stored responses should come back intact and count as hits."""
+        cache = LLMCache()
+        response = LLMResponse("print(1)", "mock", 10, 5, 15)
+
+        assert await cache.get("k") is None
+        await cache.set("k", response)
+
+        assert await cache.get("k") == response
+        assert cache.stats == {"hits": 1, "misses": 1}
+
+    @pytest.mark.asyncio
+    async def test_expired_entry_is_a_miss(self):
+        """Entries past their TTL should not be returned."""
+        cache = LLMCache(ttl=0)
+        await cache.set("k", LLMResponse("x", "mock", 1, 1, 2))
+
+        assert await cache.get("k") is None
+
+
+class TestCodeExecutorCaching:
+    """Tests for CodeExecutor's use of the cache."""
+
+    @pytest.mark.asyncio
+    async def test_deterministic_calls_are_cached(self):
+        """A repeated temperature=0 task should hit the cache."""
+        cache = LLMCache()
+        executor = CodeExecutor(MockLLMClient(latency_ms=0), temperature=0, cache=cache)
+        state = TaskState("t1", TaskType.CODE_GENERATION, "write fibonacci")
+
+        first = await executor.execute(state)
+        second = await executor.execute(state)
+
+        assert first.generated_code == second.generated_code
+        assert cache.stats == {"hits": 1, "misses": 1}
+
+    @pytest.mark.asyncio
+    async def test_sampling_calls_bypass_cache(self):
+        """Non-zero temperature should never touch the cache."""
+        cache = LLMCache()
+        executor = CodeExecutor(MockLLMClient(latency_ms=0), cache=cache)
+        state = TaskState("t1", TaskType.CODE_GENERATION, "write fibonacci")
+
+        await executor.execute(state)
+
+        assert cache.stats == {"hits": 0, "misses": 0}
+
+
+class TestInMemoryBackend:
+    """Tests for InMemoryBackend."""
+
+    @pytest.mark.asyncio
+    async def test_maxsize_evicts_oldest(self):
+        """A full backend should drop its oldest entry first."""
+        backend = InMemoryBackend(maxsize=2)
+        for key in ("a", "b", "c"):
+            await backend.set(key, {"k": key}, ttl=60)
+
+        assert await backend.get("a") is None
+        assert await backend.get("c") == {"k": "c"}
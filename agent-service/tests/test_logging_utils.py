@@ -0,0 +1,43 @@
+"""Tests for logging helpers."""
+
+import logging
+
+import pytest
+
+from app.logging_utils import log_agent_step_complete, log_agent_step_failed, logger
+
+
+class _RecordCollector(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.records: list[logging.LogRecord] = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+@pytest.fixture
+def records():
+    # pytest's own root handlers make basicConfig a no-op, leaving the
+    # effective level at WARNING
+    handler = _RecordCollector()
+    level = logger.level
+    logger.setLevel(logging.INFO)
+    logger.addHandler(handler)
+    yield handler.records
+    logger.removeHandler(handler)
+    logger.setLevel(level)
+
+
+class TestStepEndLogging:
+    """funcName is the JSON "event" field, so it must name the public helper."""
+
+    def test_step_complete_func_name(self, records):
+        log_agent_step_complete("task-1", 12.0, "ok")
+
+        assert records[-1].funcName == "log_agent_step_complete"
+
+    def test_step_failed_func_name(self, records):
+        log_agent_step_failed("task-1", 12.0, "boom")
+
+        assert records[-1].funcName == "log_agent_step_failed"
@@ -1,5 +1,7 @@
 """Tests for Module 12 data models."""
 
+from functools import lru_cache
+
 import pytest
 from app.models.agents import AgentType, AgentInfo, AgentTeam, AGENT_REGISTRY
 from app.models.planning import PlanStep, ExecutionStage, ExecutionPlan
@@ -16,6 +18,24 @@ from app.models.execution import (
 
 # ===== Agent Models Tests =====
 
+# Stand-in agents: AgentTeam only needs agent_type and agent_id
+class _MockBuilder:
+    agent_type = AgentType.BUILDER
+    agent_id = "builder-1"
+
+
+class _MockReviewer:
+    agent_type = AgentType.REVIEWER
+    agent_id = "reviewer-1"
+
+
+@pytest.fixture
+def team_with_builder():
+    team = AgentTeam()
+    team.add_agent(_MockBuilder())
+    return team
+
+
 class TestAgentType:
     def test_agent_types_exist(self):
         assert AgentType.BUILDER.value == "builder"
@@ -27,19 +47,24 @@ class TestAgentType:
             assert agent_type in AGENT_REGISTRY
 
 
+@pytest.fixture(scope="module")
+def agent_info():
+    return {agent_type: AGENT_REGISTRY[agent_type] for agent_type in AgentType}
+
+
 class TestAgentInfo:
-    def test_builder_info(self):
-        info = AGENT_REGISTRY[AgentType.BUILDER]
+    def test_builder_info(self, agent_info):
+        info = agent_info[AgentType.BUILDER]
         assert info.name == "SoftwareBuilderAgent"
         assert "code_generation" in info.capabilities
 
-    def test_reviewer_info(self):
-        info = AGENT_REGISTRY[AgentType.REVIEWER]
+    def test_reviewer_info(self, agent_info):
+        info = agent_info[AgentType.REVIEWER]
         assert info.name == "SoftwareReviewerAgent"
         assert "test_execution" in info.capabilities
 
-    def test_docgen_info(self):
-        info = AGENT_REGISTRY[AgentType.DOCGEN]
+    def test_docgen_info(self, agent_info):
+        info = agent_info[AgentType.DOCGEN]
         assert info.name == "DocumentationGeneratorAgent"
         assert "readme_generation" in info.capabilities
 
@@ -56,40 +81,28 @@ class TestAgentTeam:
         assert team.get_agents(AgentType.BUILDER) == []
         assert team.get_agent(AgentType.BUILDER) is None
 
-    def test_team_summary(self):
-        # Create mock agents (just need agent_type and agent_id attributes)
-        class MockBuilder:
-            agent_type = AgentType.BUILDER
-            agent_id = "builder-1"
-
-        class MockReviewer:
-            agent_type = AgentType.REVIEWER
-            agent_id = "reviewer-1"
+    def test_team_summary(self, team_with_builder):
+        team_with_builder.add_agent(_MockReviewer())
 
-        team = AgentTeam()
-        team.add_agent(MockBuilder())
-        team.add_agent(MockReviewer())
-
-        summary = team.get_team_summary()
+        summary = team_with_builder.get_team_summary()
         assert summary["builders"] == 1
         assert summary["reviewers"] == 1
         assert summary["docgens"] == 0
 
-    def test_get_available_types(self):
-        class MockBuilder:
-            agent_type = AgentType.BUILDER
-            agent_id = "builder-1"
-
-        team = AgentTeam()
-        team.add_agent(MockBuilder())
-
-        available = team.get_available_types()
+    def test_get_available_types(self, team_with_builder):
+        available = team_with_builder.get_available_types()
         assert AgentType.BUILDER in available
         assert AgentType.REVIEWER not in available
 
 
 # ===== Planning Models Tests =====
 
+@lru_cache(maxsize=None)
+def _step(id: str, task: str, *depends_on: str) -> PlanStep:
+    """Shared PlanStep per argument tuple. PlanStep is frozen; don't mutate depends_on."""
+    return PlanStep(id=id, task=task, depends_on=list(depends_on))
+
+
 class TestPlanStep:
     def test_basic_step(self):
         step = PlanStep(id="config", task="Define constants")
@@ -109,22 +122,23 @@ class TestPlanStep:
         assert step.depends_on == ["config"]
         assert step.complexity == "complex"
 
-    def test_step_validation_empty_id(self):
-        with pytest.raises(ValueError, match="Step id cannot be empty"):
-            PlanStep(id="", task="Some task")
-
-    def test_step_validation_empty_task(self):
-        with pytest.raises(ValueError, match="Step task cannot be empty"):
-            PlanStep(id="step1", task="")
-
-    def test_step_validation_invalid_complexity(self):
-        with pytest.raises(ValueError, match="Invalid complexity"):
-            PlanStep(id="step1", task="Task", complexity="invalid")
+    @pytest.mark.parametrize(
+        "kwargs, match",
+        [
+            ({"id": "", "task": "Some task"}, "Step id cannot be empty"),
+            ({"id": "step1", "task": ""}, "Step task cannot be empty"),
+            ({"id": "step1", "task": "Task", "complexity": "invalid"}, "Invalid complexity"),
+        ],
+        ids=["empty_id", "empty_task", "invalid_complexity"],
+    )
+    def test_step_validation(self, kwargs, match):
+        with pytest.raises(ValueError, match=match):
+            PlanStep(**kwargs)
 
 
 class TestExecutionStage:
     def test_basic_stage(self):
-        step1 = PlanStep(id="config", task="Define constants")
+        step1 = _step("config", "Define constants")
         stage = ExecutionStage(stage_number=1, steps=[step1], parallel=False)
 
         assert stage.stage_number == 1
@@ -133,107 +147,83 @@ class TestExecutionStage:
         assert not stage.parallel
 
     def test_parallel_stage(self):
-        step1 = PlanStep(id="snake", task="Snake class")
-        step2 = PlanStep(id="food", task="Food class")
+        step1 = _step("snake", "Snake class")
+        step2 = _step("food", "Food class")
         stage = ExecutionStage(stage_number=2, steps=[step1, step2], parallel=True)
 
         assert stage.step_count == 2
         assert stage.step_ids == ["snake", "food"]
         assert stage.parallel
 
-    def test_stage_validation_invalid_number(self):
-        step = PlanStep(id="step1", task="Task")
-        with pytest.raises(ValueError, match="Stage number must be >= 1"):
-            ExecutionStage(stage_number=0, steps=[step], parallel=False)
-
-    def test_stage_validation_empty_steps(self):
-        with pytest.raises(ValueError, match="Stage must have at least one step"):
-            ExecutionStage(stage_number=1, steps=[], parallel=False)
-
-
+    @pytest.mark.parametrize(
+        "stage_number, steps, match",
+        [
+            (0, [_step("step1", "Task")], "Stage number must be >= 1"),
+            (1, [], "Stage must have at least one step"),
+        ],
+        ids=["invalid_number", "empty_steps"],
+    )
+    def test_stage_validation(self, stage_number, steps, match):
+        with pytest.raises(ValueError, match=match):
+            ExecutionStage(stage_number=stage_number, steps=steps, parallel=False)
+
+
+@pytest.fixture(scope="module")
+def simple_plan():
+    step = _step("config", "Define constants")
+    stage = ExecutionStage(stage_number=1, steps=[step], parallel=False)
+    return ExecutionPlan(
+        task="Create snake game",
+        reasoning="Test plan",
+        stages=[stage],
+        team_summary={"builders": 1, "reviewers": 1, "docgens": 1}
+    )
+
+
+@pytest.fixture(scope="module")
+def parallel_plan():
+    step1 = _step("config", "Config")
+    step2 = _step("snake", "Snake", "config")
+    step3 = _step("food", "Food", "config")
+
+    stage1 = ExecutionStage(stage_number=1, steps=[step1], parallel=False)
+    stage2 = ExecutionStage(stage_number=2, steps=[step2, step3], parallel=True)
+
+    return ExecutionPlan(
+        task="Game",
+        reasoning="Test",
+        stages=[stage1, stage2],
+        team_summary={"builders": 1, "reviewers": 1, "docgens": 1}
+    )
+
+
+# Plans are frozen, so the module-scoped fixtures are safe to share
 class TestExecutionPlan:
-    def test_basic_plan(self):
-        step1 = PlanStep(id="config", task="Define constants")
-        stage1 = ExecutionStage(stage_number=1, steps=[step1], parallel=False)
-
-        plan = ExecutionPlan(
-            task="Create snake game",
-            reasoning="Simple game with config and snake class",
-            stages=[stage1],
-            team_summary={"builders": 1, "reviewers": 1, "docgens": 1}
-        )
-
-        assert plan.task == "Create snake game"
-        assert plan.total_steps == 1
-        assert plan.total_stages == 1
-        assert plan.parallelizable_steps == 0
-
-    def test_plan_with_parallel_stage(self):
-        step1 = PlanStep(id="config", task="Config")
-        step2 = PlanStep(id="snake", task="Snake", depends_on=["config"])
-        step3 = PlanStep(id="food", task="Food", depends_on=["config"])
-
-        stage1 = ExecutionStage(stage_number=1, steps=[step1], parallel=False)
-        stage2 = ExecutionStage(stage_number=2, steps=[step2, step3], parallel=True)
-
-        plan = ExecutionPlan(
-            task="Game",
-            reasoning="Test",
-            stages=[stage1, stage2],
-            team_summary={"builders": 1, "reviewers": 1, "docgens": 1}
-        )
-
-        assert plan.total_steps == 3
-        assert plan.total_stages == 2
-        assert plan.parallelizable_steps == 2  # snake and food are parallel
-
-    def test_get_step(self):
-        step1 = PlanStep(id="config", task="Config")
-        stage1 = ExecutionStage(stage_number=1, steps=[step1], parallel=False)
-
-        plan = ExecutionPlan(
-            task="Game",
-            reasoning="Test",
-            stages=[stage1],
-            team_summary={}
-        )
-
-        assert plan.get_step("config") == step1
-        assert plan.get_step("nonexistent") is None
-
-    def test_to_mermaid(self):
-        step1 = PlanStep(id="config", task="Define constants")
-        step2 = PlanStep(id="snake", task="Snake class", depends_on=["config"])
-
-        stage1 = ExecutionStage(stage_number=1, steps=[step1], parallel=False)
-        stage2 = ExecutionStage(stage_number=2, steps=[step2], parallel=False)
-
-        plan = ExecutionPlan(
-            task="Game",
-            reasoning="Test",
-            stages=[stage1, stage2],
-            team_summary={}
-        )
-
-        mermaid = plan.to_mermaid()
+    def test_basic_plan(self, simple_plan):
+        assert simple_plan.task == "Create snake game"
+        assert simple_plan.total_steps == 1
+        assert simple_plan.total_stages == 1
+        assert simple_plan.parallelizable_steps == 0
+
+    def test_plan_with_parallel_stage(self, parallel_plan):
+        assert parallel_plan.total_steps == 3
+        assert parallel_plan.total_stages == 2
+        assert parallel_plan.parallelizable_steps == 2  # snake and food are parallel
+
+    def test_get_step(self, simple_plan):
+        assert simple_plan.get_step("config") is simple_plan.stages[0].steps[0]
+        assert simple_plan.get_step("nonexistent") is None
+
+    def test_to_mermaid(self, parallel_plan):
+        mermaid = parallel_plan.to_mermaid()
         assert "graph TD" in mermaid
         assert "config" in mermaid
         assert "snake" in mermaid
         assert "config --> snake" in mermaid
 
-    def test_to_dict(self):
-        step1 = PlanStep(id="config", task="Config")
-        stage1 = ExecutionStage(stage_number=1, steps=[step1], parallel=False)
-
-        plan = ExecutionPlan(
-            task="Game",
-            reasoning="Test plan",
-            stages=[stage1],
-            team_summary={"builders": 1, "reviewers": 1, "docgens": 0}
-        )
-
-        d = plan.to_dict()
-        assert d["task"] == "Game"
+    def test_to_dict(self, simple_plan):
+        d = simple_plan.to_dict()
+        assert d["task"] == "Create snake game"
         assert d["reasoning"] == "Test plan"
         assert d["total_steps"] == 1
         assert d["total_stages"] == 1
@@ -288,17 +278,43 @@ class TestCodeOutput:
         assert output.test_lines == 0
 
 
-class TestReviewIssue:
-    def test_basic_issue(self):
-        issue = ReviewIssue(
-            severity="error",
-            category="correctness",
-            message="Test failed: assertion error"
-        )
+@pytest.fixture(scope="module")
+def error_issue():
+    # ReviewIssue is frozen, so one instance can be shared
+    return ReviewIssue(
+        severity="error",
+        category="correctness",
+        message="Failed"
+    )
+
 
-        assert issue.severity == "error"
-        assert issue.category == "correctness"
-        assert issue.suggestion is None
+@pytest.fixture
+def passed_result():
+    return ReviewResult(
+        step_id="config",
+        tests_passed=True,
+        test_output="All tests passed",
+        review_passed=True,
+        issues=[]
+    )
+
+
+@pytest.fixture
+def failed_result(error_issue):
+    return ReviewResult(
+        step_id="config",
+        tests_passed=False,
+        test_output="1 test failed",
+        review_passed=True,
+        issues=[error_issue]
+    )
+
+
+class TestReviewIssue:
+    def test_basic_issue(self, error_issue):
+        assert error_issue.severity == "error"
+        assert error_issue.category == "correctness"
+        assert error_issue.suggestion is None
 
     def test_issue_with_suggestion(self):
         issue = ReviewIssue(
@@ -310,56 +326,29 @@ class TestReviewIssue:
 
         assert issue.suggestion == "Break into smaller functions"
 
-    def test_issue_validation(self):
+    @pytest.mark.parametrize("severity", ["invalid", ""])
+    def test_issue_validation(self, severity):
         with pytest.raises(ValueError, match="Invalid severity"):
-            ReviewIssue(severity="invalid", category="test", message="test")
+            ReviewIssue(severity=severity, category="test", message="test")
 
-    def test_to_dict(self):
-        issue = ReviewIssue(
-            severity="error",
-            category="correctness",
-            message="Failed"
-        )
-        d = issue.to_dict()
+    def test_to_dict(self, error_issue):
+        d = error_issue.to_dict()
         assert d["severity"] == "error"
         assert d["category"] == "correctness"
 
 
 class TestReviewResult:
-    def test_passed_review(self):
-        result = ReviewResult(
-            step_id="config",
-            tests_passed=True,
-            test_output="All tests passed",
-            review_passed=True,
-            issues=[]
-        )
+    def test_passed_review(self, passed_result):
+        assert passed_result.overall_passed
+        assert passed_result.error_count == 0
+        assert passed_result.warning_count == 0
 
-        assert result.overall_passed
-        assert result.error_count == 0
-        assert result.warning_count == 0
+    def test_failed_review(self, failed_result):
+        assert not failed_result.overall_passed
+        assert failed_result.error_count == 1
 
-    def test_failed_review(self):
-        issue = ReviewIssue(severity="error", category="test", message="Failed")
-        result = ReviewResult(
-            step_id="config",
-            tests_passed=False,
-            test_output="1 test failed",
-            review_passed=True,
-            issues=[issue]
-        )
-
-        assert not result.overall_passed
-        assert result.error_count == 1
-
-    def test_to_dict(self):
-        result = ReviewResult(
-            step_id="config",
-            tests_passed=True,
-            test_output="OK",
-            review_passed=True
-        )
-        d = result.to_dict()
+    def test_to_dict(self, passed_result):
+        d = passed_result.to_dict()
         assert d["overall_passed"] is True
         assert "issues" in d
 
@@ -388,48 +377,33 @@ class TestDocumentedCode:
 
 
 class TestProjectResult:
-    def test_successful_result(self):
-        result = ProjectResult(
-            code="def main(): pass",
-            tests="def test_main(): pass",
-            readme="# Project",
-            total_steps=5,
-            total_attempts=7,
-            duration_ms=45000,
-            success=True
-        )
-
-        assert result.success
-        assert result.code_lines == 1
-        assert result.test_lines == 1
-        assert result.error_message is None
-
-    def test_failed_result(self):
+    @pytest.mark.parametrize(
+        "code, tests, error_message, success",
+        [
+            ("def main(): pass", "def test_main(): pass", None, True),
+            ("", "", "Max retries exceeded", False),
+            ("x = 1", "", None, True),
+        ],
+        ids=["successful", "failed", "code_only"],
+    )
+    def test_project_result(self, code, tests, error_message, success):
         result = ProjectResult(
-            code="",
-            tests="",
+            code=code,
+            tests=tests,
             readme="",
             total_steps=2,
-            total_attempts=6,
+            total_attempts=3,
             duration_ms=30000,
-            success=False,
-            error_message="Max retries exceeded"
+            success=success,
+            error_message=error_message
         )
 
-        assert not result.success
-        assert result.error_message == "Max retries exceeded"
+        assert result.success is success
+        assert result.error_message == error_message
+        assert result.code_lines == (1 if code else 0)
+        assert result.test_lines == (1 if tests else 0)
 
-    def test_to_dict(self):
-        result = ProjectResult(
-            code="x = 1",
-            tests="",
-            readme="",
-            total_steps=1,
-            total_attempts=1,
-            duration_ms=1000,
-            success=True
-        )
         d = result.to_dict()
-        assert d["success"] is True
-        assert d["code_lines"] == 1
-        assert "duration_ms" in d
+        assert d["success"] is success
+        assert d["code_lines"] == result.code_lines
+        assert d["duration_ms"] == 30000
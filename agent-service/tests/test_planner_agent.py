@@ -1,30 +1,64 @@
 """Tests for PlannerAgent class."""
 
 import pytest
+import pytest_asyncio
 
 from app.agents.planner import PlannerAgent, PlannerConfig
 from app.llm import get_registry, reset_registry
 from app.llm.mock_client import MockLLMClient
 
-
-@pytest.fixture(autouse=True)
-def setup_mock_registry(monkeypatch):
-    """Reset registry and use mock LLM for all tests."""
-    monkeypatch.setenv("USE_MOCK_LLM", "true")
-    reset_registry()
-    yield
+# Every test is async; run them all on one module-wide event loop, the
+# same loop the module-scoped plan fixtures use
+pytestmark = pytest.mark.asyncio(loop_scope="module")
+
+
+# Expected planner event sequences
+_SIMPLE_EVENT_SEQUENCE = (
+    "plan_start",
+    "plan_analysis",
+    "plan_step_identified",  # One step for simple task
+    "plan_complete",
+)
+# start, analysis, 5 step_identified, complete
+_SNAKE_EVENT_SEQUENCE = (
+    "plan_start",
+    "plan_analysis",
+    *("plan_step_identified",) * 5,
+    "plan_complete",
+)
+
+
+@pytest.fixture(autouse=True, scope="module")
+def setup_mock_registry():
+    """Use a mock LLM registry for every test in the module."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("USE_MOCK_LLM", "true")
+        mp.setenv("MOCK_LLM_LATENCY_MS", "0")
+        reset_registry()
+        yield
     reset_registry()
 
 
+# create_plan is deterministic under the mock LLM, so the two canonical
+# prompts are planned once per module. Tests must not mutate the results.
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def sort_plan(setup_mock_registry):
+    """(plan, events) for the simple "Sort a list" task."""
+    return await PlannerAgent(request_id="test123").create_plan("Sort a list")
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def snake_plan(setup_mock_registry):
+    """(plan, events) for the complex "Create a snake game" task."""
+    return await PlannerAgent(request_id="test123").create_plan("Create a snake game")
+
+
 class TestPlannerAgentSimpleTask:
     """Tests for simple task handling."""
 
-    @pytest.mark.asyncio
-    async def test_simple_task_creates_single_step_plan(self):
+    async def test_simple_task_creates_single_step_plan(self, sort_plan):
         """Simple task should create plan with one step."""
-        agent = PlannerAgent(request_id="test123")
-
-        plan, events = await agent.create_plan("Sort a list")
+        plan, events = sort_plan
 
         assert len(plan.steps) == 1
         assert plan.steps[0].id == "main"
@@ -32,7 +66,6 @@ class TestPlannerAgentSimpleTask:
         assert plan.steps[0].complexity == "simple"
         assert plan.reasoning == "Simple task - single step execution"
 
-    @pytest.mark.asyncio
     async def test_simple_task_skips_llm_call(self):
         """Simple task should NOT call LLM."""
         # Get the mock client to track calls
@@ -51,19 +84,15 @@ class TestPlannerAgentSimpleTask:
 class TestPlannerAgentComplexTask:
     """Tests for complex task handling."""
 
-    @pytest.mark.asyncio
-    async def test_complex_task_creates_multi_step_plan(self):
+    async def test_complex_task_creates_multi_step_plan(self, snake_plan):
         """Complex task should create plan with multiple steps."""
-        agent = PlannerAgent(request_id="test123")
-
-        plan, events = await agent.create_plan("Create a snake game")
+        plan, events = snake_plan
 
         assert len(plan.steps) == 5
         assert plan.steps[0].id == "config"
         assert "snake" in [s.id for s in plan.steps]
         assert "food" in [s.id for s in plan.steps]
 
-    @pytest.mark.asyncio
     async def test_complex_task_calls_llm(self):
         """Complex task should call LLM."""
         registry = get_registry()
@@ -77,12 +106,9 @@ class TestPlannerAgentComplexTask:
         # LLM should have been called once
         assert mock_client.call_count == initial_count + 1
 
-    @pytest.mark.asyncio
-    async def test_complex_task_has_dependencies(self):
+    async def test_complex_task_has_dependencies(self, snake_plan):
         """Complex task plan should have dependency relationships."""
-        agent = PlannerAgent(request_id="test123")
-
-        plan, events = await agent.create_plan("Create a snake game")
+        plan, events = snake_plan
 
         # Find snake step
         snake_step = plan.get_step("snake")
@@ -99,40 +125,25 @@ class TestPlannerAgentComplexTask:
 class TestSSEEventsSimpleTask:
     """Tests for SSE event sequence on simple tasks."""
 
-    @pytest.mark.asyncio
-    async def test_sse_events_sequence_simple_task(self):
+    async def test_sse_events_sequence_simple_task(self, sort_plan):
         """Simple task should emit correct event sequence."""
-        agent = PlannerAgent(request_id="test123")
-
-        plan, events = await agent.create_plan("Sort a list")
+        plan, events = sort_plan
 
         # Check event types in order
-        event_types = [e["event"] for e in events]
-        assert event_types == [
-            "plan_start",
-            "plan_analysis",
-            "plan_step_identified",  # One step for simple task
-            "plan_complete",
-        ]
-
-    @pytest.mark.asyncio
-    async def test_plan_start_event_contains_task(self):
-        """plan_start event should contain the task."""
-        agent = PlannerAgent(request_id="test123")
+        assert tuple(e["event"] for e in events) == _SIMPLE_EVENT_SEQUENCE
 
-        plan, events = await agent.create_plan("Sort a list")
+    async def test_plan_start_event_contains_task(self, sort_plan):
+        """plan_start event should contain the task."""
+        plan, events = sort_plan
 
         start_event = events[0]
         assert start_event["event"] == "plan_start"
         assert start_event["task"] == "Sort a list"
         assert "timestamp" in start_event
 
-    @pytest.mark.asyncio
-    async def test_plan_analysis_event_simple_task(self):
+    async def test_plan_analysis_event_simple_task(self, sort_plan):
         """plan_analysis should show is_complex=False for simple task."""
-        agent = PlannerAgent(request_id="test123")
-
-        plan, events = await agent.create_plan("Sort a list")
+        plan, events = sort_plan
 
         analysis_event = events[1]
         assert analysis_event["event"] == "plan_analysis"
@@ -143,43 +154,26 @@ class TestSSEEventsSimpleTask:
 class TestSSEEventsComplexTask:
     """Tests for SSE event sequence on complex tasks."""
 
-    @pytest.mark.asyncio
-    async def test_sse_events_sequence_complex_task(self):
+    async def test_sse_events_sequence_complex_task(self, snake_plan):
         """Complex task should emit correct event sequence."""
-        agent = PlannerAgent(request_id="test123")
-
-        plan, events = await agent.create_plan("Create a snake game")
+        plan, events = snake_plan
 
-        event_types = [e["event"] for e in events]
-
-        # Should have: start, analysis, 5 step_identified, complete
-        assert event_types[0] == "plan_start"
-        assert event_types[1] == "plan_analysis"
-        assert event_types[-1] == "plan_complete"
-
-        # Count step_identified events
-        step_events = [e for e in events if e["event"] == "plan_step_identified"]
-        assert len(step_events) == 5
+        assert tuple(e["event"] for e in events) == _SNAKE_EVENT_SEQUENCE
 
-    @pytest.mark.asyncio
-    async def test_plan_analysis_event_complex_task(self):
+    async def test_plan_analysis_event_complex_task(self, snake_plan):
         """plan_analysis should show is_complex=True for complex task."""
-        agent = PlannerAgent(request_id="test123")
-
-        plan, events = await agent.create_plan("Create a snake game")
+        plan, events = snake_plan
 
         analysis_event = events[1]
         assert analysis_event["event"] == "plan_analysis"
         assert analysis_event["is_complex"] is True
 
-    @pytest.mark.asyncio
-    async def test_plan_step_identified_events(self):
+    async def test_plan_step_identified_events(self, snake_plan):
         """plan_step_identified events should contain step details."""
-        agent = PlannerAgent(request_id="test123")
-
-        plan, events = await agent.create_plan("Create a snake game")
+        plan, events = snake_plan
 
         step_events = [e for e in events if e["event"] == "plan_step_identified"]
+        by_id = {e["step_id"]: e for e in step_events}
 
         # Check first step (config)
         config_event = step_events[0]
@@ -189,53 +183,41 @@ class TestSSEEventsComplexTask:
         assert config_event["complexity"] == "simple"
 
         # Check a step with dependencies
-        snake_event = next(e for e in step_events if e["step_id"] == "snake")
+        snake_event = by_id["snake"]
         assert "config" in snake_event["depends_on"]
 
 
 class TestPlanCompleteEvent:
     """Tests for plan_complete event."""
 
-    @pytest.mark.asyncio
-    async def test_plan_complete_contains_mermaid(self):
+    async def test_plan_complete_contains_mermaid(self, snake_plan):
         """plan_complete should contain Mermaid diagram."""
-        agent = PlannerAgent(request_id="test123")
-
-        plan, events = await agent.create_plan("Create a snake game")
+        plan, events = snake_plan
 
         complete_event = events[-1]
         assert complete_event["event"] == "plan_complete"
         assert "mermaid" in complete_event
         assert complete_event["mermaid"].startswith("graph TD")
 
-    @pytest.mark.asyncio
-    async def test_plan_complete_contains_total_steps(self):
+    async def test_plan_complete_contains_total_steps(self, snake_plan):
         """plan_complete should contain total step count."""
-        agent = PlannerAgent(request_id="test123")
-
-        plan, events = await agent.create_plan("Create a snake game")
+        plan, events = snake_plan
 
         complete_event = events[-1]
         assert complete_event["total_steps"] == 5
 
-    @pytest.mark.asyncio
-    async def test_plan_complete_contains_parallel_stages_count(self):
+    async def test_plan_complete_contains_parallel_stages_count(self, snake_plan):
         """Snake game should have multiple parallel stages."""
-        agent = PlannerAgent(request_id="test123")
-
-        plan, events = await agent.create_plan("Create a snake game")
+        plan, events = snake_plan
 
         complete_event = events[-1]
         # Snake game: config -> (snake, food parallel) -> collision -> game_loop
         # That's 4 stages
         assert complete_event["parallel_stages"] == 4
 
-    @pytest.mark.asyncio
-    async def test_simple_task_has_one_stage(self):
+    async def test_simple_task_has_one_stage(self, sort_plan):
         """Simple task should have exactly 1 parallel stage."""
-        agent = PlannerAgent(request_id="test123")
-
-        plan, events = await agent.create_plan("Sort a list")
+        plan, events = sort_plan
 
         complete_event = events[-1]
         assert complete_event["parallel_stages"] == 1
@@ -244,7 +226,12 @@ class TestPlanCompleteEvent:
 class TestPlannerAgentRegistry:
     """Tests for registry integration."""
 
-    @pytest.mark.asyncio
+    @pytest.fixture(autouse=True)
+    def restore_registry(self):
+        """Drop the customized registry so later tests get a clean one."""
+        yield
+        reset_registry()
+
     async def test_uses_registry_planner_role(self, monkeypatch):
         """PlannerAgent should get client from registry with 'planner' role."""
         monkeypatch.setenv("USE_MOCK_LLM", "true")
@@ -263,7 +250,6 @@ class TestPlannerAgentRegistry:
 class TestPlannerAgentConfig:
     """Tests for PlannerConfig usage."""
 
-    @pytest.mark.asyncio
     async def test_default_config_used_when_none_provided(self):
         """Should use default PlannerConfig when none provided."""
         agent = PlannerAgent(request_id="test123")
@@ -272,7 +258,6 @@ class TestPlannerAgentConfig:
         assert agent.config.max_steps == 10
         assert agent.config.min_complexity_words == 15
 
-    @pytest.mark.asyncio
     async def test_custom_config_used(self):
         """Should use provided PlannerConfig."""
         custom_config = PlannerConfig(max_steps=5, min_complexity_words=3)
@@ -281,7 +266,6 @@ class TestPlannerAgentConfig:
         assert agent.config.max_steps == 5
         assert agent.config.min_complexity_words == 3
 
-    @pytest.mark.asyncio
     async def test_high_min_complexity_makes_all_tasks_simple(self):
         """With very high min_complexity_words, all tasks are simple."""
         # Set threshold so high that even "game" keyword won't trigger complexity
@@ -299,12 +283,9 @@ class TestPlannerAgentConfig:
 class TestPlannerAgentTimestamps:
     """Tests for event timestamps."""
 
-    @pytest.mark.asyncio
-    async def test_all_events_have_timestamps(self):
+    async def test_all_events_have_timestamps(self, snake_plan):
         """All events should have timestamp field."""
-        agent = PlannerAgent(request_id="test123")
-
-        plan, events = await agent.create_plan("Create a snake game")
+        plan, events = snake_plan
 
         for event in events:
             assert "timestamp" in event
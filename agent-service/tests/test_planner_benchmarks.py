@@ -0,0 +1,40 @@
+"""Micro-benchmarks for the planner request path (requires pytest-benchmark)."""
+
+import asyncio
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from app.agents.planner import PlannerAgent, get_mock_plan_response, parse_llm_response
+from app.llm import reset_registry
+
+
+@pytest.fixture(autouse=True)
+def setup_mock_registry(monkeypatch):
+    """Plan against a zero-latency mock LLM."""
+    monkeypatch.setenv("USE_MOCK_LLM", "true")
+    monkeypatch.setenv("MOCK_LLM_LATENCY_MS", "0")
+    reset_registry()
+    yield
+    reset_registry()
+
+
+def test_bench_create_plan_snake(benchmark):
+    """Full complex-task planning: analysis, mock LLM call, parse, staging, Mermaid."""
+    agent = PlannerAgent(request_id="bench")
+
+    plan, events = benchmark(
+        lambda: asyncio.run(agent.create_plan("Create a snake game"))
+    )
+
+    assert len(plan.steps) == 5
+
+
+def test_bench_parse_llm_response(benchmark):
+    """Parsing and validating the snake-game plan response."""
+    response = get_mock_plan_response("Create a snake game")
+
+    plan = benchmark(parse_llm_response, response, "Create a snake game")
+
+    assert len(plan.steps) == 5
@@ -21,7 +21,12 @@ class TestParseLlmResponse:
         response = json.dumps({
             "reasoning": "Simple task",
             "steps": [
-                {"id": "main", "task": "Print hello", "depends_on": [], "complexity": "simple"}
+                {
+                    "id": "main",
+                    "task": "Print hello",
+                    "depends_on": [],
+                    "complexity": "simple",
+                }
             ]
         })
 
@@ -42,8 +47,10 @@ class TestParseLlmResponse:
 {
     "reasoning": "Multi-step task",
     "steps": [
-        {"id": "step1", "task": "First step", "depends_on": [], "complexity": "simple"},
-        {"id": "step2", "task": "Second step", "depends_on": ["step1"], "complexity": "medium"}
+        {"id": "step1", "task": "First step", "depends_on": [],
+         "complexity": "simple"},
+        {"id": "step2", "task": "Second step", "depends_on": ["step1"],
+         "complexity": "medium"}
     ]
 }
 ```"""
@@ -72,10 +79,30 @@ class TestParseLlmResponse:
         response = json.dumps({
             "reasoning": "Snake game breakdown",
             "steps": [
-                {"id": "config", "task": "Config", "depends_on": [], "complexity": "simple"},
-                {"id": "snake", "task": "Snake class", "depends_on": ["config"], "complexity": "medium"},
-                {"id": "food", "task": "Food class", "depends_on": ["config"], "complexity": "simple"},
-                {"id": "game", "task": "Game loop", "depends_on": ["snake", "food"], "complexity": "complex"},
+                {
+                    "id": "config",
+                    "task": "Config",
+                    "depends_on": [],
+                    "complexity": "simple",
+                },
+                {
+                    "id": "snake",
+                    "task": "Snake class",
+                    "depends_on": ["config"],
+                    "complexity": "medium",
+                },
+                {
+                    "id": "food",
+                    "task": "Food class",
+                    "depends_on": ["config"],
+                    "complexity": "simple",
+                },
+                {
+                    "id": "game",
+                    "task": "Game loop",
+                    "depends_on": ["snake", "food"],
+                    "complexity": "complex",
+                },
             ]
         })
 
@@ -91,101 +118,85 @@ class TestParseLlmResponse:
         assert set(s.id for s in stages[1]) == {"snake", "food"}
         assert [s.id for s in stages[2]] == ["game"]
 
-    def test_parse_invalid_json_raises_error(self):
-        """Invalid JSON should raise ValueError."""
-        response = "This is not JSON at all"
-
-        with pytest.raises(ValueError) as exc_info:
-            parse_llm_response(response, "Test")
-
-        assert "Invalid JSON" in str(exc_info.value)
-
-    def test_parse_missing_reasoning_raises_error(self):
-        """Missing reasoning field should raise ValueError."""
-        response = json.dumps({
-            "steps": [{"id": "main", "task": "Test", "depends_on": []}]
-        })
-
-        with pytest.raises(ValueError) as exc_info:
-            parse_llm_response(response, "Test")
-
-        assert "reasoning" in str(exc_info.value)
-
-    def test_parse_missing_steps_raises_error(self):
-        """Missing steps field should raise ValueError."""
-        response = json.dumps({
-            "reasoning": "Test reasoning"
-        })
-
-        with pytest.raises(ValueError) as exc_info:
-            parse_llm_response(response, "Test")
-
-        assert "steps" in str(exc_info.value)
-
-    def test_parse_empty_steps_raises_error(self):
-        """Empty steps list should raise ValueError."""
-        response = json.dumps({
-            "reasoning": "Test",
-            "steps": []
-        })
-
-        with pytest.raises(ValueError) as exc_info:
-            parse_llm_response(response, "Test")
-
-        assert "empty" in str(exc_info.value).lower()
-
-    def test_parse_step_missing_id_raises_error(self):
-        """Step without id should raise ValueError."""
-        response = json.dumps({
-            "reasoning": "Test",
-            "steps": [{"task": "Test", "depends_on": []}]
-        })
-
-        with pytest.raises(ValueError) as exc_info:
-            parse_llm_response(response, "Test")
-
-        assert "id" in str(exc_info.value)
-
-    def test_parse_step_missing_task_raises_error(self):
-        """Step without task should raise ValueError."""
+    def test_parse_independent_steps_form_one_stage(self):
+        """Steps without dependencies should all land in a single stage, in order."""
         response = json.dumps({
-            "reasoning": "Test",
-            "steps": [{"id": "main", "depends_on": []}]
-        })
-
-        with pytest.raises(ValueError) as exc_info:
-            parse_llm_response(response, "Test")
-
-        assert "task" in str(exc_info.value)
-
-    def test_parse_duplicate_step_ids_raises_error(self):
-        """Duplicate step IDs should raise ValueError."""
-        response = json.dumps({
-            "reasoning": "Test",
+            "reasoning": "Independent utilities",
             "steps": [
-                {"id": "main", "task": "First", "depends_on": []},
-                {"id": "main", "task": "Second", "depends_on": []},
+                {"id": "parse", "task": "Parser", "depends_on": []},
+                {"id": "format", "task": "Formatter", "depends_on": []},
+                {"id": "validate", "task": "Validator", "depends_on": []},
             ]
         })
 
-        with pytest.raises(ValueError) as exc_info:
-            parse_llm_response(response, "Test")
+        plan = parse_llm_response(response, "Build utilities")
 
-        assert "Duplicate" in str(exc_info.value)
+        stages = plan.get_execution_stages()
+        assert len(stages) == 1
+        assert [s.id for s in stages[0]] == ["parse", "format", "validate"]
 
-    def test_parse_unknown_dependency_raises_error(self):
-        """Dependency on non-existent step should raise ValueError."""
-        response = json.dumps({
-            "reasoning": "Test",
-            "steps": [
-                {"id": "main", "task": "Main step", "depends_on": ["nonexistent"]}
-            ]
-        })
+    def test_parse_invalid_json_raises_error(self):
+        """Invalid JSON should raise ValueError."""
+        response = "This is not JSON at all"
 
-        with pytest.raises(ValueError) as exc_info:
+        with pytest.raises(ValueError, match="Invalid JSON"):
             parse_llm_response(response, "Test")
 
-        assert "unknown step" in str(exc_info.value).lower()
+    @pytest.mark.parametrize(
+        "payload, match",
+        [
+            (
+                {"steps": [{"id": "main", "task": "Test", "depends_on": []}]},
+                "reasoning",
+            ),
+            ({"reasoning": "Test reasoning"}, "steps"),
+            ({"reasoning": "Test", "steps": []}, "(?i)empty"),
+            (
+                {"reasoning": "Test", "steps": [{"task": "Test", "depends_on": []}]},
+                "id",
+            ),
+            (
+                {"reasoning": "Test", "steps": [{"id": "main", "depends_on": []}]},
+                "task",
+            ),
+            (
+                {
+                    "reasoning": "Test",
+                    "steps": [
+                        {"id": "main", "task": "First", "depends_on": []},
+                        {"id": "main", "task": "Second", "depends_on": []},
+                    ],
+                },
+                "Duplicate",
+            ),
+            (
+                {
+                    "reasoning": "Test",
+                    "steps": [
+                        {
+                            "id": "main",
+                            "task": "Main step",
+                            "depends_on": ["nonexistent"],
+                        }
+                    ],
+                },
+                "(?i)unknown step",
+            ),
+        ],
+        ids=[
+            "missing_reasoning",
+            "missing_steps",
+            "empty_steps",
+            "step_missing_id",
+            "step_missing_task",
+            "duplicate_step_ids",
+            "unknown_dependency",
+        ],
+    )
+    def test_parse_invalid_plan_raises_error(self, payload, match):
+        """Structurally invalid plans should raise ValueError naming the problem."""
+        with pytest.raises(ValueError, match=match):
+            parse_llm_response(json.dumps(payload), "Test")
 
     def test_parse_defaults_complexity_to_medium(self):
         """Missing complexity should default to medium."""
@@ -202,7 +213,14 @@ class TestParseLlmResponse:
         """Invalid complexity value should default to medium."""
         response = json.dumps({
             "reasoning": "Test",
-            "steps": [{"id": "main", "task": "Test", "depends_on": [], "complexity": "invalid"}]
+            "steps": [
+                {
+                    "id": "main",
+                    "task": "Test",
+                    "depends_on": [],
+                    "complexity": "invalid",
+                }
+            ]
         })
 
         plan = parse_llm_response(response, "Test")
@@ -236,7 +254,10 @@ class TestIsComplexTask:
         """Tasks with many words are complex."""
         config = PlannerConfig(min_complexity_words=5)
 
-        long_task = "Create a function that takes a list of numbers and returns the sorted version"
+        long_task = (
+            "Create a function that takes a list of numbers "
+            "and returns the sorted version"
+        )
         assert is_complex_task(long_task, config) is True
 
     def test_complex_task_by_keyword_game(self):
@@ -346,19 +367,21 @@ class TestMockResponses:
 class TestIntegration:
     """Integration tests combining multiple components."""
 
-    def test_mock_response_parses_to_valid_plan(self):
+    @pytest.mark.parametrize(
+        "task", ["snake game", "calculator", "todo app", "REST api"]
+    )
+    def test_mock_response_parses_to_valid_plan(self, task):
         """Mock responses should parse into valid ProjectPlans."""
-        for task in ["snake game", "calculator", "todo app", "REST api"]:
-            response = get_mock_plan_response(task)
-            plan = parse_llm_response(response, task)
+        response = get_mock_plan_response(task)
+        plan = parse_llm_response(response, task)
 
-            # Should produce valid execution stages
-            stages = plan.get_execution_stages()
-            assert len(stages) >= 1
+        # Should produce valid execution stages
+        stages = plan.get_execution_stages()
+        assert len(stages) >= 1
 
-            # Should produce valid Mermaid
-            mermaid = plan.to_mermaid()
-            assert mermaid.startswith("graph TD")
+        # Should produce valid Mermaid
+        mermaid = plan.to_mermaid()
+        assert mermaid.startswith("graph TD")
 
     def test_end_to_end_snake_game(self):
         """Full end-to-end test for snake game planning."""
@@ -0,0 +1,50 @@
+"""Tests for SyntaxEvaluator."""
+
+import pytest
+
+from app.core.task_state import TaskState, TaskType
+from app.evaluators.syntax_evaluator import SyntaxEvaluator
+
+
+def _state(code: str | None) -> TaskState:
+    return TaskState("t1", TaskType.CODE_GENERATION, "write code", generated_code=code)
+
+
+class TestSyntaxEvaluator:
+    """Tests for SyntaxEvaluator.evaluate."""
+
+    @pytest.mark.asyncio
+    async def test_valid_code_passes(self):
+        result = await SyntaxEvaluator().evaluate(_state("def f():\n    return 1\n"))
+
+        assert result.passed
+        assert result.score == 1.0
+
+    @pytest.mark.asyncio
+    async def test_whitespace_only_is_empty(self):
+        result = await SyntaxEvaluator().evaluate(_state("  \n\t"))
+
+        assert not result.passed
+        assert result.feedback == "No code was generated"
+
+    @pytest.mark.asyncio
+    async def test_truncated_code_fails_fast(self):
+        """Unbalanced brackets without strings are rejected before parsing."""
+        result = await SyntaxEvaluator().evaluate(_state("values = [1, 2,"))
+
+        assert not result.passed
+        assert result.feedback == "Syntax error: unbalanced brackets"
+
+    @pytest.mark.asyncio
+    async def test_brackets_in_strings_are_not_miscounted(self):
+        """Code with string literals falls through to ast.parse."""
+        result = await SyntaxEvaluator().evaluate(_state('print(")")'))
+
+        assert result.passed
+
+    @pytest.mark.asyncio
+    async def test_syntax_error_reports_line(self):
+        result = await SyntaxEvaluator().evaluate(_state("x = 1\nif True\n    pass\n"))
+
+        assert not result.passed
+        assert result.feedback.startswith("Syntax error at line 2")
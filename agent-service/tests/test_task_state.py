@@ -0,0 +1,63 @@
+"""Tests for TaskState."""
+
+from dataclasses import fields
+
+from app.core.task_state import TaskState, TaskStatus, TaskType
+
+
+class TestTaskStateToDict:
+    """Tests for TaskState.to_dict."""
+
+    def test_includes_every_field(self):
+        """to_dict should stay in sync with the dataclass fields."""
+        state = TaskState("t1", TaskType.CODE_FIX, "fix it")
+
+        public = {f.name for f in fields(TaskState) if not f.name.startswith("_")}
+
+        assert set(state.to_dict()) == public
+
+    def test_enums_serialize_as_values(self):
+        """Enum fields should be plain strings."""
+        state = TaskState(
+            "t1", TaskType.CODE_FIX, "fix it", status=TaskStatus.COMPLETED
+        )
+
+        data = state.to_dict()
+
+        assert data["task_type"] == "code_fix"
+        assert data["status"] == "completed"
+
+    def test_test_results_not_copied(self):
+        """Nested test_results should be shared, not deep-copied."""
+        results = {"passed": 3}
+        state = TaskState("t1", TaskType.CODE_TESTING, "test it", test_results=results)
+
+        assert state.to_dict()["test_results"] is results
+
+
+class TestContextHash:
+    """Tests for TaskState.context_hash."""
+
+    def test_none_without_context(self):
+        """No context means no hash."""
+        assert TaskState("t1", TaskType.CODE_FIX, "fix it").context_hash is None
+
+    def test_recomputed_when_context_changes(self):
+        """with_updates should not carry a stale hash forward."""
+        state = TaskState("t1", TaskType.CODE_FIX, "fix it", context="a = 1")
+        updated = state.with_updates(context="a = 2")
+
+        assert state.context_hash != updated.context_hash
+        assert updated.context_hash == updated.with_updates(retry_count=1).context_hash
+
+    def test_recomputed_when_context_assigned(self):
+        """Assigning context directly should invalidate the memoized hash."""
+        state = TaskState("t1", TaskType.CODE_FIX, "fix it", context="a = 1")
+        before = state.context_hash
+
+        state.context = "a = 2"
+
+        assert state.context_hash != before
+        assert state.context_hash == TaskState(
+            "t2", TaskType.CODE_FIX, "fix it", context="a = 2"
+        ).context_hash